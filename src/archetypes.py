@@ -2,8 +2,9 @@
 Archetype definitions for Psycho-Dice-Namic
 """
 
-from typing import List, Dict, Any
-from dataclasses import dataclass
+import functools
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Type
+from dataclasses import InitVar, dataclass, field, fields
 from dice import (
     Dice, NormalDice, BlissDice, ComedownDice, BlankDice,
     HighMindedDice, SpiteDice, InebriationDice, GroundedDice, NostalgiaDice,
@@ -15,100 +16,174 @@ from dice import (
 # Centralized game constants
 MAX_HEALTH = 12
 
+# Shape of every apply_special_effects result; copied rather than rebuilt per roll
+_EFFECTS_TEMPLATE: Dict[str, Any] = {"heal": 0, "damage": 0, "forgiveness_tokens": 0}
 
-@dataclass
+# Player token counters, in Player.tokens order; each name is also a Player attribute
+TOKEN_FIELDS: Tuple[str, ...] = (
+    "forgiveness_tokens", "neurosis_tokens", "regret_tokens", "eureka_tokens",
+    "breakthrough_tokens", "rehash_tokens", "fumble_shields",
+)
+TOKEN_INDEX: Dict[str, int] = {name: i for i, name in enumerate(TOKEN_FIELDS)}
+_FORGIVENESS_IDX = TOKEN_INDEX["forgiveness_tokens"]
+_NEUROSIS_IDX = TOKEN_INDEX["neurosis_tokens"]
+_REGRET_IDX = TOKEN_INDEX["regret_tokens"]
+
+
+@dataclass(slots=True)
 class Player:
     """Represents a player in the game"""
     name: str
     health: int = MAX_HEALTH
-    forgiveness_tokens: int = 0
-    neurosis_tokens: int = 0
-    regret_tokens: int = 0
-    eureka_tokens: int = 0
-    breakthrough_tokens: int = 0
-    rehash_tokens: int = 0
-    fumble_shields: int = 0
+    # Token counts are accepted by name (and position) as before, then stored in tokens
+    forgiveness_tokens: InitVar[int] = 0
+    neurosis_tokens: InitVar[int] = 0
+    regret_tokens: InitVar[int] = 0
+    eureka_tokens: InitVar[int] = 0
+    breakthrough_tokens: InitVar[int] = 0
+    rehash_tokens: InitVar[int] = 0
+    fumble_shields: InitVar[int] = 0
+    # All token counts in one list, indexed by TOKEN_INDEX; read and written by name through properties
+    tokens: List[int] = field(init=False)
     bust_protection: bool = False
     penance_double_active: bool = False
     pending_pilfer_next_round: bool = False
-    pending_echo_values: List[int] = None
-    totems: Dict[str, Any] = None
-    emotions: List[Any] = None
+    pending_echo_values: List[int] = field(default_factory=list)
+    totems: Dict[str, Any] = field(default_factory=dict)
+    emotions: List[Any] = field(default_factory=list)
     win_counter: int = 0
     force_commit: bool = False
-    dice: List[Dice] = None
-
-    def __post_init__(self):
-        if self.dice is None:
-            self.dice = []
-        if self.pending_echo_values is None:
-            self.pending_echo_values = []
-        if self.totems is None:
-            self.totems = {}
-        if self.emotions is None:
-            self.emotions = []
+    dice: List[Dice] = field(default_factory=list)
+    # Loadout metadata attached by simulators (not used by the engine yet)
+    bias_psych: List[str] = field(default_factory=list)
+    bias_somatic: List[str] = field(default_factory=list)
+
+    def __post_init__(self, forgiveness_tokens: int, neurosis_tokens: int, regret_tokens: int,
+                      eureka_tokens: int, breakthrough_tokens: int, rehash_tokens: int,
+                      fumble_shields: int):
+        self.tokens = [forgiveness_tokens, neurosis_tokens, regret_tokens, eureka_tokens,
+                       breakthrough_tokens, rehash_tokens, fumble_shields]
+
+    def __repr__(self) -> str:
+        parts = []
+        for f in fields(self):
+            if f.name == "tokens":
+                # Spell the counts out by name, as the separate token fields used to
+                parts += [f"{name}={count!r}" for name, count in zip(TOKEN_FIELDS, self.tokens)]
+            elif f.repr:
+                parts.append(f"{f.name}={getattr(self, f.name)!r}")
+        return f"{type(self).__name__}({', '.join(parts)})"
 
     def take_damage(self, amount: int) -> int:
         """Take damage, return actual damage taken"""
-        actual_damage = min(amount, self.health)
-        self.health -= actual_damage
+        health = self.health
+        actual_damage = amount if amount < health else health
+        self.health = health - actual_damage
         return actual_damage
 
     def heal(self, amount: int) -> int:
         """Heal, return actual healing done"""
-        actual_healing = min(amount, MAX_HEALTH - self.health)
-        self.health += actual_healing
+        health = self.health
+        room = MAX_HEALTH - health
+        actual_healing = amount if amount < room else room
+        self.health = health + actual_healing
         return actual_healing
 
     def add_forgiveness_token(self):
         """Add a forgiveness token"""
-        self.forgiveness_tokens += 1
+        self.tokens[_FORGIVENESS_IDX] += 1
 
     def add_neurosis_tokens(self, amount: int = 1):
         """Add neurosis tokens"""
         if amount > 0:
-            self.neurosis_tokens += amount
+            self.tokens[_NEUROSIS_IDX] += amount
 
     def add_regret_tokens(self, amount: int = 1):
         """Add regret tokens"""
         if amount > 0:
-            self.regret_tokens += amount
+            self.tokens[_REGRET_IDX] += amount
 
     def use_forgiveness_token(self) -> bool:
         """Use a forgiveness token to heal 1, return True if used"""
-        if self.forgiveness_tokens > 0:
-            self.forgiveness_tokens -= 1
+        tokens = self.tokens
+        if tokens[_FORGIVENESS_IDX] > 0:
+            tokens[_FORGIVENESS_IDX] -= 1
             self.heal(1)
             return True
         return False
 
 
+def _token_property(index: int, name: str) -> property:
+    def get(self) -> int:
+        return self.tokens[index]
+
+    def set(self, value: int) -> None:
+        self.tokens[index] = value
+
+    return property(get, set, doc=f"Count of {name}, stored in Player.tokens")
+
+
+for _i, _name in enumerate(TOKEN_FIELDS):
+    setattr(Player, _name, _token_property(_i, _name))
+del _i, _name
+
+
 class Archetype:
-    """Base class for player archetypes"""
+    """Base class for player archetypes.
+    Subclasses declare NAME and DICE_SPEC (dice classes); the prototype dice are built once per class.
+    """
+
+    __slots__ = ("name", "dice", "_dice_factories")
 
-    def __init__(self, name: str, dice: List[Dice]):
-        self.name = name
-        self.dice = dice
+    NAME: str = ""
+    DICE_SPEC: Tuple[Type[Dice], ...] = ()
+
+    @classmethod
+    def _prototype(cls) -> Tuple[Dice, ...]:
+        """Prototype dice for this class, built lazily on first use"""
+        proto = cls.__dict__.get("_PROTOTYPE")
+        if proto is None:
+            proto = tuple(dice_cls() for dice_cls in cls.DICE_SPEC)
+            cls._PROTOTYPE = proto
+        return proto
+
+    def __init__(self, name: Optional[str] = None, dice: Optional[Sequence[Dice]] = None):
+        self.name = type(self).NAME if name is None else name
+        # Archetype dice never change after construction; players get their own mutable list
+        self.dice: Tuple[Dice, ...] = type(self)._prototype() if dice is None else tuple(dice)
+        # Clone recipe computed once; each player gets its own dice instances
+        self._dice_factories = [d.clone for d in self.dice]
 
     def create_player(self, player_name: str) -> Player:
-        """Create a new player with this archetype's dice"""
+        """Create a new player with copies of this archetype's dice"""
         return Player(
             name=player_name,
-            dice=[dice for dice in self.dice]  # Create copies
+            dice=[f() for f in self._dice_factories]
         )
 
-    def apply_special_effects(self, player: Player, dice_results: List[int]) -> Dict[str, Any]:
-        """Apply any special effects from rolled dice"""
-        effects: Dict[str, Any] = {"heal": 0, "damage": 0, "forgiveness_tokens": 0}
-
-        for i, result in enumerate(dice_results):
-            if i < len(player.dice):
-                dice_effects = player.dice[i].special_effect(result, player)
-                for k, v in dice_effects.items():
-                    if isinstance(v, (int, float)):
-                        effects[k] = effects.get(k, 0) + v
-                    else:
-                        effects[k] = v
+    def apply_special_effects(self, player: Player, dice_results: List[int], *,
+                              heal_to_forgiveness: bool = False) -> Dict[str, Any]:
+        """Apply any special effects from rolled dice.
+        With heal_to_forgiveness, healing is credited as forgiveness tokens instead.
+        """
+        effects: Dict[str, Any] = _EFFECTS_TEMPLATE.copy()
+        heal_key = "forgiveness_tokens" if heal_to_forgiveness else "heal"
+
+        # zip stops at the shorter of results/dice (e.g. when echo values were appended)
+        for result, die in zip(dice_results, player.dice):
+            # Most rolls land on a face with no effect; skip the special_effect call for those
+            if result not in die.EFFECTS:
+                continue
+            dice_effects = die.special_effect(result, player)
+            if not dice_effects:
+                continue
+            # Each die class declares which keys accumulate and which override
+            for k in die.NUMERIC_KEYS & dice_effects.keys():
+                key = heal_key if k == "heal" else k
+                effects[key] = effects.get(key, 0) + dice_effects[k]
+            if die.OVERRIDE_KEYS:
+                for k in die.OVERRIDE_KEYS & dice_effects.keys():
+                    effects[k] = dice_effects[k]
 
         return effects
 
@@ -116,43 +191,31 @@ class Archetype:
 class TabulaRasa(Archetype):
     """Tabula Rasa: 6x normal white d6"""
 
-    def __init__(self):
-        super().__init__("Tabula Rasa", [NormalDice() for _ in range(6)])
+    __slots__ = ()
+    NAME = "Tabula Rasa"
+    DICE_SPEC = (NormalDice,) * 6
 
 
 class Hedonist(Archetype):
     """The Hedonist: Bliss + Comedown + 4x normal"""
 
-    def __init__(self):
-        super().__init__("The Hedonist", [
-            BlissDice(), ComedownDice(),
-            NormalDice(), NormalDice(), NormalDice(), NormalDice()
-        ])
+    __slots__ = ()
+    NAME = "The Hedonist"
+    DICE_SPEC = (BlissDice, ComedownDice) + (NormalDice,) * 4
+
+
 class Euphoria(Archetype):
     """Euphoria: 1x Bliss Dice, 1x Comedown Dice, 4x normal d6"""
 
-    def __init__(self):
-        super().__init__("Euphoria", [
-            BlissDice(),
-            ComedownDice(),
-            NormalDice(),
-            NormalDice(),
-            NormalDice(),
-            NormalDice()
-        ])
+    __slots__ = ()
+    NAME = "Euphoria"
+    DICE_SPEC = (BlissDice, ComedownDice) + (NormalDice,) * 4
 
     def apply_special_effects(self, player: Player, dice_results: List[int]) -> Dict[str, Any]:
-        """Apply Euphoria-specific special effects"""
-        effects = super().apply_special_effects(player, dice_results)
-
-        # Euphoria special rule: can take forgiveness token instead of healing
-        if effects["heal"] > 0:
-            # For now, always take forgiveness tokens instead of healing
-            # In a real game, this would be a player choice
-            effects["forgiveness_tokens"] += effects["heal"]
-            effects["heal"] = 0
-
-        return effects
+        """Euphoria special rule: take forgiveness tokens instead of healing.
+        For now this is always chosen; in a real game it would be a player choice.
+        """
+        return super().apply_special_effects(player, dice_results, heal_to_forgiveness=True)
 
 
 class Temperance(Archetype):
@@ -160,11 +223,9 @@ class Temperance(Archetype):
     Post-commit: compute humor totals of banked dice and apply top humor effect.
     """
 
-    def __init__(self):
-        super().__init__(
-            "Temperance",
-            [CholericDie(), MelancholicDie(), PhlegmaticDie(), SanguineDie(), NormalDice(), NormalDice()]
-        )
+    __slots__ = ()
+    NAME = "Temperance"
+    DICE_SPEC = (CholericDie, MelancholicDie, PhlegmaticDie, SanguineDie, NormalDice, NormalDice)
 
     def apply_special_effects(self, player: Player, dice_results: List[int]) -> Dict[str, Any]:
         # On-roll effects are none for Temperance; commit-time handled in engine future hook
@@ -176,21 +237,17 @@ class Intellectualism(Archetype):
     The raise is handled at bank time in engine (future hook).
     """
 
-    def __init__(self):
-        super().__init__(
-            "Intellectualism",
-            [HighMindedDice(), HighMindedDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice()]
-        )
+    __slots__ = ()
+    NAME = "Intellectualism"
+    DICE_SPEC = (HighMindedDice, HighMindedDice) + (NormalDice,) * 4
 
 
 class Belligerence(Archetype):
     """Belligerence: Spite + Inebriation + 4x normal"""
 
-    def __init__(self):
-        super().__init__(
-            "Belligerence",
-            [SpiteDice(), InebriationDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice()]
-        )
+    __slots__ = ()
+    NAME = "Belligerence"
+    DICE_SPEC = (SpiteDice, InebriationDice) + (NormalDice,) * 4
 
     def apply_special_effects(self, player: Player, dice_results: List[int]) -> Dict[str, Any]:
         effects = super().apply_special_effects(player, dice_results)
@@ -205,7 +262,10 @@ class Naivety(Archetype):
     - Nostalgia: creates echo die with same value until next roll (engine hook).
     """
 
+    __slots__ = ()
+
     def __init__(self):
+        # SimpletonsDice is not defined yet, so this archetype can't use a class-level DICE_SPEC
         super().__init__(
             "Naïvety",
             [SimpletonsDice(), NostalgiaDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice()]
@@ -218,11 +278,9 @@ class Guilt(Archetype):
     - Acedic: on 6 heal 1, and if 0 regret tokens, gain 1 regret.
     """
 
-    def __init__(self):
-        super().__init__(
-            "Guilt",
-            [PenanceDice(), AcedicDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice()]
-        )
+    __slots__ = ()
+    NAME = "Guilt"
+    DICE_SPEC = (PenanceDice, AcedicDice) + (NormalDice,) * 4
 
 
 class Jealousy(Archetype):
@@ -230,11 +288,9 @@ class Jealousy(Archetype):
     If both Pilfer dice roll a 6, steal a live die from opponent (engine clash/roll hook).
     """
 
-    def __init__(self):
-        super().__init__(
-            "Jealousy",
-            [PilferDice(), PilferDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice()]
-        )
+    __slots__ = ()
+    NAME = "Jealousy"
+    DICE_SPEC = (PilferDice, PilferDice) + (NormalDice,) * 4
 
 
 class Anxiety(Archetype):
@@ -243,76 +299,40 @@ class Anxiety(Archetype):
     - Ridicule: on 6: if no regret, gain one; else transfer one to opponent (engine clash hook).
     """
 
-    def __init__(self):
-        super().__init__(
-            "Anxiety",
-            [CatastrophizeDice(), RidiculeDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice()]
-        )
-
-
-# New renamed archetypes per latest spec
-class Physiognomist(Archetype):
-    def __init__(self):
-        super().__init__(
-            "The Physiognomist",
-            [CholericDie(), MelancholicDie(), PhlegmaticDie(), SanguineDie(), NormalDice(), NormalDice()]
-        )
-
-class Rationalist(Archetype):
-    def __init__(self):
-        super().__init__(
-            "The Rationalist",
-            [HighMindedDice(), HighMindedDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice()]
-        )
-
-class Fatalist(Archetype):
-    def __init__(self):
-        super().__init__(
-            "The Fatalist",
-            [SpiteDice(), InebriationDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice()]
-        )
-
-class Transcendentalist(Archetype):
-    def __init__(self):
-        super().__init__(
-            "The Transcendentalist",
-            [GroundedDice(), NostalgiaDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice()]
-        )
-
-class Puritan(Archetype):
-    def __init__(self):
-        super().__init__(
-            "The Puritan",
-            [PenanceDice(), AcedicDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice()]
-        )
+    __slots__ = ()
+    NAME = "Anxiety"
+    DICE_SPEC = (CatastrophizeDice, RidiculeDice) + (NormalDice,) * 4
+
+
+# New renamed archetypes per latest spec: special dice padded to six with normal d6.
+# (class name, display name, special dice)
+_ARCHETYPE_SPECS: Tuple[Tuple[str, str, Tuple[Type[Dice], ...]], ...] = (
+    ("Physiognomist", "The Physiognomist", (CholericDie, MelancholicDie, PhlegmaticDie, SanguineDie)),
+    ("Rationalist", "The Rationalist", (HighMindedDice, HighMindedDice)),
+    ("Fatalist", "The Fatalist", (SpiteDice, InebriationDice)),
+    ("Transcendentalist", "The Transcendentalist", (GroundedDice, NostalgiaDice)),
+    ("Puritan", "The Puritan", (PenanceDice, AcedicDice)),
+    ("Machiavalian", "The Machiavalian", (PilferDice, PilferDice)),
+    ("Absurdist", "The Absurdist", (AporicDice, NauseaDice)),
+    ("Stoic", "The Stoic", (ApatheticDice,)),
+    ("Nihilist", "The Nihilist", (AbyssalDice,)),
+)
 
-class Machiavalian(Archetype):
-    def __init__(self):
-        super().__init__(
-            "The Machiavalian",
-            [PilferDice(), PilferDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice()]
-        )
 
-class Absurdist(Archetype):
-    def __init__(self):
-        super().__init__(
-            "The Absurdist",
-            [AporicDice(), NauseaDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice()]
-        )
+def _make_archetype_class(class_name: str, name: str, specials: Tuple[Type[Dice], ...]) -> Type[Archetype]:
+    """Build an Archetype subclass whose dice are the given specials plus normal d6 up to six"""
+    return type(class_name, (Archetype,), {
+        "__doc__": f"{name}: " + " + ".join(d.__name__ for d in specials) + f" + {6 - len(specials)}x normal",
+        "__module__": __name__,
+        "__slots__": (),
+        "NAME": name,
+        "DICE_SPEC": specials + (NormalDice,) * (6 - len(specials)),
+    })
 
-class Stoic(Archetype):
-    def __init__(self):
-        super().__init__(
-            "The Stoic",
-            [ApatheticDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice()]
-        )
 
-class Nihilist(Archetype):
-    def __init__(self):
-        super().__init__(
-            "The Nihilist",
-            [AbyssalDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice(), NormalDice()]
-        )
+for _class_name, _name, _specials in _ARCHETYPE_SPECS:
+    globals()[_class_name] = _make_archetype_class(_class_name, _name, _specials)
+del _class_name, _name, _specials
 
 
 # Special face dice for testing
@@ -322,107 +342,119 @@ class SpecialFaceDice(Dice):
     def __init__(self, faces: List[int], name: str = "Special"):
         super().__init__(faces, name)
 
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        return {}
-
 
 def create_special_dice(faces: List[int], name: str = "Special") -> SpecialFaceDice:
     """Create a special face dice with the given faces"""
     return SpecialFaceDice(faces, name)
 
 
+# Shared face tuple for plain d6 faces (referenced by several definitions below)
+_D6 = (1, 2, 3, 4, 5, 6)
+
 # Predefined special dice for testing
-SPECIAL_DICE_DEFINITIONS = {
-    "normal_d6": [1, 2, 3, 4, 5, 6],  # Normal d6 for baseline
-    "extra high": [1, 2, 3, 4, 6, 6],
-    "extra low": [1, 1, 3, 4, 5, 6],
-    "extreme": [1, 1, 1, 6, 6, 6],
-    "evens": [2, 2, 4, 4, 6, 6],
-    "odds": [1, 1, 3, 3, 5, 5],
-    "missing 1": [None, 2, 3, 4, 5, 6],  # X, 2, 3, 4, 5, 6
-    "missing 6": [1, 2, 3, 4, 5, None],  # 1, 2, 3, 4, 5, X
-    "more 3s": [1, 3, 3, 3, 3, 6],
-    "more middle": [1, 2, 4, 4, 5, 6],
-    "all_blank": [None, None, None, None, None, None],  # X, X, X, X, X, X
-    "half_blank": [1, 2, 3, None, None, None]  # 1, 2, 3, X, X, X
+SPECIAL_DICE_DEFINITIONS: Dict[str, Tuple[Optional[int], ...]] = {
+    "normal_d6": _D6,  # Normal d6 for baseline
+    "extra high": (1, 2, 3, 4, 6, 6),
+    "extra low": (1, 1, 3, 4, 5, 6),
+    "extreme": (1, 1, 1, 6, 6, 6),
+    "evens": (2, 2, 4, 4, 6, 6),
+    "odds": (1, 1, 3, 3, 5, 5),
+    "missing 1": (None, 2, 3, 4, 5, 6),  # X, 2, 3, 4, 5, 6
+    "missing 6": (1, 2, 3, 4, 5, None),  # 1, 2, 3, 4, 5, X
+    "more 3s": (1, 3, 3, 3, 3, 6),
+    "more middle": (1, 2, 4, 4, 5, 6),
+    "all_blank": (None, None, None, None, None, None),  # X, X, X, X, X, X
+    "half_blank": (1, 2, 3, None, None, None)  # 1, 2, 3, X, X, X
 }
 
+_D6_HIGH = (2, 3, 4, 5, 6, 6)
+
 # Defense dice faces (name -> faces)
-DEFENSE_DICE_DEFINITIONS: Dict[str, List[int]] = {
-    "Halo-Effect": [1, 2, 3, 3, 4, 4],
-    "Scapegoat": [2, 3, 4, 5, 6, 6],
-    "Normalcy": [1, 2, 3, 4, 5, 6],
-    "Just-World": [1, 2, 3, 4, 5, 6],
-    "Victimhood": [None, 1, 2, 4, 5, 6],
-    "Dunning-Kruger": [2, 3, 4, 5, 6, 6],
-    "Mere-Exposure": [1, 2, 3, 4, 5, 6],
-    "Egocentric": [1, 1, 2, 2, 6, 6],
-    "Illusory-Control": [1, 2, 3, 4, 5, 6],
-    "Bandwagon": [1, 2, 3, 4, 5, 6],
-    "Narrative-Fallacy": [1, 2, 3, 4, 5, 6],
-    "Groupshift": [1, 2, 3, 4, 5, 6],
+DEFENSE_DICE_DEFINITIONS: Dict[str, Tuple[Optional[int], ...]] = {
+    "Halo-Effect": (1, 2, 3, 3, 4, 4),
+    "Scapegoat": _D6_HIGH,
+    "Normalcy": _D6,
+    "Just-World": _D6,
+    "Victimhood": (None, 1, 2, 4, 5, 6),
+    "Dunning-Kruger": _D6_HIGH,
+    "Mere-Exposure": _D6,
+    "Egocentric": (1, 1, 2, 2, 6, 6),
+    "Illusory-Control": _D6,
+    "Bandwagon": _D6,
+    "Narrative-Fallacy": _D6,
+    "Groupshift": _D6,
 }
 
-# Human-readable defense dice descriptions
-DEFENSE_DICE_DESCRIPTIONS: Dict[str, Dict[str, str]] = {
-    "Halo-Effect": {
-        "subtitle": "Defense Die",
-        "psych": "Triggers when this die is live, and any other of your live dice lands on a 6. Includes normal rolling, as well as manual changing.",
-        "som": "Triggers when your roll contains zero 6s."
-    },
-    "Scapegoat": {
-        "subtitle": "Defense Die",
-        "psych": "If this die is live during a fumble, roll a d6: triggers that many times.",
-        "som": "If you successfully commit 3 separate insults in a single debate, gain a eureka token."
-    },
-    "Normalcy": {
-        "subtitle": "Defense Die",
-        "psych": "Triggers when banked as part of a one-pair.",
-        "som": "Trigger after rolling only odd faces."
-    },
-    "Just-World": {
-        "subtitle": "Defense Die",
-        "psych": "Trigger when banking four or more dice in a single insult.",
-        "som": "Trigger after rolling only even faces."
-    },
-    "Victimhood": {
-        "subtitle": "Defense Die",
-        "psych": "Whenever you take more than 3 damage, roll a d6. If the result is < the damage you took, gain a breakthrough token.",
-        "som": "Whenever you lose a debate, gain a eureka token."
-    },
-    "Dunning-Kruger": {
-        "subtitle": "Defense Die",
-        "psych": "Triggers when you bank an insult of only 1s.",
-        "som": "Whenever you fumble, gain 1 fumble-shield token and 1 breakthrough token. (Prevented fumbles do not activate 'when you fumble' triggers)"
-    },
-    "Mere-Exposure": {
-        "subtitle": "Defense Die",
-        "psych": "Triggers any time you bank an insult that contains a 1.",
-        "som": "Every time you roll a '1', place a counter on this card. When it reaches 6, remove it, and trigger this 3 times."
-    },
-    "Egocentric": {
-        "subtitle": "Defense Die",
-        "psych": "Trigger every time you deal exactly 1 damage.",
-        "som": "At the start of each round, triggers twice for every debate that has passed."
-    },
-    "Illusory-Control": {
-        "subtitle": "Defense Die",
-        "psych": "Triggers every time you receive a token (not by its imbued emotion).",
-        "som": "Triggers every time you decrement a token (but not 'clearing' tokens)."
-    },
-    "Bandwagon": {
-        "subtitle": "Defense Die",
-        "psych": "Triggers any time an echo die is summoned by yourself or opponents (not by its imbued emotion).",
-        "som": "Increase your max live die count by 1. You can convert one of your somatic dice back to psychological, and roll it alongside your default 6. (Bandwagon Die has no somatic trigger)"
-    },
-    "Narrative-Fallacy": {
-        "subtitle": "Defense Die",
-        "psych": "Triggers when banking a straight.",
-        "som": "Triggers every roll, if every live die has the normal faces [1, 2, 3, 5, 6]."
-    },
-    "Groupshift": {
-        "subtitle": "Defense Die",
-        "psych": "If you bank 5 or more dice, and still lose the debate, gain a eureka token.",
-        "som": "If you bank 3 or less dice, and win the debate, gain a breakthrough token."
-    },
-}
+
+# Human-readable defense dice descriptions, built on first use (headless sims never need the text)
+@functools.cache
+def defense_dice_descriptions() -> Dict[str, Dict[str, str]]:
+    return {
+        "Halo-Effect": {
+            "subtitle": "Defense Die",
+            "psych": "Triggers when this die is live, and any other of your live dice lands on a 6. Includes normal rolling, as well as manual changing.",
+            "som": "Triggers when your roll contains zero 6s."
+        },
+        "Scapegoat": {
+            "subtitle": "Defense Die",
+            "psych": "If this die is live during a fumble, roll a d6: triggers that many times.",
+            "som": "If you successfully commit 3 separate insults in a single debate, gain a eureka token."
+        },
+        "Normalcy": {
+            "subtitle": "Defense Die",
+            "psych": "Triggers when banked as part of a one-pair.",
+            "som": "Trigger after rolling only odd faces."
+        },
+        "Just-World": {
+            "subtitle": "Defense Die",
+            "psych": "Trigger when banking four or more dice in a single insult.",
+            "som": "Trigger after rolling only even faces."
+        },
+        "Victimhood": {
+            "subtitle": "Defense Die",
+            "psych": "Whenever you take more than 3 damage, roll a d6. If the result is < the damage you took, gain a breakthrough token.",
+            "som": "Whenever you lose a debate, gain a eureka token."
+        },
+        "Dunning-Kruger": {
+            "subtitle": "Defense Die",
+            "psych": "Triggers when you bank an insult of only 1s.",
+            "som": "Whenever you fumble, gain 1 fumble-shield token and 1 breakthrough token. (Prevented fumbles do not activate 'when you fumble' triggers)"
+        },
+        "Mere-Exposure": {
+            "subtitle": "Defense Die",
+            "psych": "Triggers any time you bank an insult that contains a 1.",
+            "som": "Every time you roll a '1', place a counter on this card. When it reaches 6, remove it, and trigger this 3 times."
+        },
+        "Egocentric": {
+            "subtitle": "Defense Die",
+            "psych": "Trigger every time you deal exactly 1 damage.",
+            "som": "At the start of each round, triggers twice for every debate that has passed."
+        },
+        "Illusory-Control": {
+            "subtitle": "Defense Die",
+            "psych": "Triggers every time you receive a token (not by its imbued emotion).",
+            "som": "Triggers every time you decrement a token (but not 'clearing' tokens)."
+        },
+        "Bandwagon": {
+            "subtitle": "Defense Die",
+            "psych": "Triggers any time an echo die is summoned by yourself or opponents (not by its imbued emotion).",
+            "som": "Increase your max live die count by 1. You can convert one of your somatic dice back to psychological, and roll it alongside your default 6. (Bandwagon Die has no somatic trigger)"
+        },
+        "Narrative-Fallacy": {
+            "subtitle": "Defense Die",
+            "psych": "Triggers when banking a straight.",
+            "som": "Triggers every roll, if every live die has the normal faces [1, 2, 3, 5, 6]."
+        },
+        "Groupshift": {
+            "subtitle": "Defense Die",
+            "psych": "If you bank 5 or more dice, and still lose the debate, gain a eureka token.",
+            "som": "If you bank 3 or less dice, and win the debate, gain a breakthrough token."
+        },
+    }
+
+
+def __getattr__(name: str):
+    """Serve the legacy DEFENSE_DICE_DESCRIPTIONS constant, now built lazily by defense_dice_descriptions()"""
+    if name == "DEFENSE_DICE_DESCRIPTIONS":
+        return defense_dice_descriptions()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,376 +2,376 @@
 Dice system for Psycho-Dice-Namic
 """
 
-from typing import List, Tuple, Optional, Dict, Any
+from types import MappingProxyType
+from typing import List, Tuple, Optional, Dict, FrozenSet, Mapping, Sequence, Type
 from dataclasses import dataclass
-from abc import ABC, abstractmethod
+from abc import ABC
+import functools
 import random
 
+# Face slots of a six-sided die, for drawing a whole pool in one call
+_D6_SLOTS = range(6)
+# Face values a combo can be built from (blanks are filtered out before detection)
+_FACE_VALUES = range(1, 7)
+# Same values high to low, for picking the highest qualifying face first
+_FACE_VALUES_DESC = range(6, 0, -1)
+# Shared read-only 'no effect' result for special_effect
+_NO_EFFECT: Mapping[str, int] = MappingProxyType({})
+# Straights as (length, name, echo_dice), longest first
+_STRAIGHTS = ((6, "Surprising", 1), (5, "Solid", 0), (4, "Solid", 0), (3, "Solid", 0))
 
-@dataclass
+
+@dataclass(slots=True)
 class Combo:
-    """Represents a dice combination"""
+    """Represents a dice combination (damage is the sum of the dice, passed in by the builder)"""
     name: str
     dice: List[int]
     echo_dice: int = 0
     damage: int = 0
 
-    def __post_init__(self):
-        """Calculate damage based on dice values"""
-        self.damage = sum(self.dice)
-
 
 class Dice(ABC):
     """Abstract base class for dice"""
 
-    def __init__(self, faces: List[int], name: str = "Dice"):
-        self.faces = faces
-        self.name = name
+    # Effect keys special_effect may return: summed across dice vs. last-write-wins
+    NUMERIC_KEYS: FrozenSet[str] = frozenset({"heal", "damage", "forgiveness_tokens"})
+    OVERRIDE_KEYS: FrozenSet[str] = frozenset()
+
+    # Faces and display name shared by every instance of a class; subclasses override these
+    FACES: Tuple[Optional[int], ...] = ()
+    NAME: str = "Dice"
+    # Face value -> effects dict returned by special_effect; faces not listed here never have an effect
+    EFFECTS: Dict[int, Dict[str, int]] = {}
+    # Index into HUMORS for humor-colored dice, -1 for the rest; set once per class from its color
+    HUMOR: int = -1
+    # Random source for every roll; defaults to the module-level generator behind random.seed()
+    rng: random.Random = random._inst
+
+    def __init__(self, faces: Optional[Sequence[Optional[int]]] = None, name: Optional[str] = None) -> None:
+        self.faces = self.FACES if faces is None else faces
+        self.name = self.NAME if name is None else name
         self.last_value: Optional[int] = None
+        # Frozen copy of the faces for rolling (class FACES are shared as-is); same draw as random.choice(self.faces)
+        self._faces: Tuple[Optional[int], ...] = tuple(self.faces)
+        self._n = len(self._faces)
 
-    def roll(self) -> int:
+    def roll(self) -> Optional[int]:
         """Roll the dice and return the result"""
-        self.last_value = random.choice(self.faces)
+        self.last_value = self.rng.choice(self._faces)
         return self.last_value
 
-    def can_roll(self) -> bool:
-        """Check if this dice can be rolled (not blank)"""
-        return True
-
-    @abstractmethod
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        """Apply special effects when this value is rolled"""
-        pass
-
-
-class NormalDice(Dice):
-    """Standard d6"""
-
-    def __init__(self):
-        super().__init__([1, 2, 3, 4, 5, 6], "Normal")
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        return {}
-
-
-class BlissDice(Dice):
-    """Bliss Dice: 2, 3, 4, 5, 6, 6 - Heals on 6"""
-
-    def __init__(self):
-        super().__init__([2, 3, 4, 5, 6, 6], "Bliss")
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        if value == 6:
-            return {"heal": 1}
-        return {}
-
-
-class ComedownDice(Dice):
-    """Comedown Dice: 2, 2, 2, 4, 4, 6 - Damage on 6, forgiveness tokens"""
-
-    def __init__(self):
-        super().__init__([2, 2, 2, 4, 4, 6], "Comedown")
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        if value == 6:
-            return {"damage": 1}
-        return {}
-
-
-class HighMindedDice(Dice):
-    """High-minded Dice: 1,1,2,3,4,6 - on bank 6 raise combo (handled at bank time)"""
-
-    def __init__(self):
-        super().__init__([1, 1, 2, 3, 4, 6], "High-Minded")
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        return {}
-
-
-class SpiteDice(Dice):
-    """Spite Dice: X, X, 1, 1, 6, 6 - on 6 deal 1 opp damage"""
-
-    def __init__(self):
-        super().__init__([None, None, 1, 1, 6, 6], "Spite")
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        if value == 6:
-            return {"opp_damage": 1}
-        return {}
-
-
-class InebriationDice(Dice):
-    """Inebriation Dice: X,X,1,1,6,6 - on 6: take 1 regret to give 1 neurosis"""
-
-    def __init__(self):
-        super().__init__([None, None, 1, 1, 6, 6], "Inebriation")
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        if value == 6:
-            return {"self_regret": 1, "opp_neurosis": 1}
-        return {}
-
-
-class GroundedDice(Dice):
-    """Grounded Dice: X,1,2,3,4,4 - pair grants echo 1 to the insult (handled at bank time)"""
-
-    def __init__(self):
-        super().__init__([None, 1, 2, 3, 4, 4], "Grounded")
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        return {}
-
-
-class NostalgiaDice(Dice):
-    """Nostalgia Dice: X,1,2,3,4,4 - creates echo at banking (handled later)"""
-
-    def __init__(self):
-        super().__init__([None, 1, 2, 3, 4, 4], "Nostalgia")
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        return {}
+    @staticmethod
+    def roll_many(dice_list: Sequence["Dice"]) -> List[Optional[int]]:
+        """Roll several dice at once: one random.choices call draws a face slot for every
+        six-sided die, then each die gathers its face from that slot.
+        Blank dice (can_roll() is False) give -1, matching GameEngine.roll_dice.
+        """
+        results: List[Optional[int]] = [-1] * len(dice_list)
+        six_sided: List[int] = []
+        for i, d in enumerate(dice_list):
+            if not d.can_roll():
+                continue
+            if d._n == 6:
+                six_sided.append(i)
+            else:
+                results[i] = d.roll()
+        if six_sided:
+            for i, slot in zip(six_sided, Dice.rng.choices(_D6_SLOTS, k=len(six_sided))):
+                d = dice_list[i]
+                d.last_value = results[i] = d._faces[slot]
+        return results
 
+    @staticmethod
+    def set_rng(rng: random.Random) -> None:
+        """Give all dice their own generator (e.g. one seeded random.Random per simulation worker)"""
+        Dice.rng = rng
 
-class PenanceDice(Dice):
-    """Penance Dice: 1..6 - on fumble with last roll >=4 doubles incoming damage (handled on fumble)"""
+    def clone(self) -> "Dice":
+        """Cheap copy sharing the (immutable) face list with this die"""
+        new = object.__new__(type(self))
+        new.__dict__ = self.__dict__.copy()
+        return new
 
-    def __init__(self):
-        super().__init__([1, 2, 3, 4, 5, 6], "Penance")
+    def can_roll(self) -> bool:
+        """Check if this dice can be rolled (not blank)"""
+        return True
 
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        return {}
+    def special_effect(self, value: int, player: object) -> Mapping[str, int]:
+        """Apply special effects when this value is rolled (shared dicts: read, don't mutate)"""
+        return self.EFFECTS.get(value, _NO_EFFECT)
+
+
+# Dice that differ only in faces, name and rolled effects:
+# (class name, display name, faces, effects by face, docstring). None is a blank face (X).
+_DICE_SPECS: Tuple[Tuple[str, str, Tuple[Optional[int], ...], Dict[int, Dict[str, int]], str], ...] = (
+    ("NormalDice", "Normal", (1, 2, 3, 4, 5, 6), {}, "Standard d6"),
+    ("BlissDice", "Bliss", (2, 3, 4, 5, 6, 6), {6: {"heal": 1}}, "Bliss Dice: 2, 3, 4, 5, 6, 6 - Heals on 6"),
+    ("ComedownDice", "Comedown", (2, 2, 2, 4, 4, 6), {6: {"damage": 1}},
+     "Comedown Dice: 2, 2, 2, 4, 4, 6 - Damage on 6, forgiveness tokens"),
+    ("HighMindedDice", "High-Minded", (1, 1, 2, 3, 4, 6), {},
+     "High-minded Dice: 1,1,2,3,4,6 - on bank 6 raise combo (handled at bank time)"),
+    ("SpiteDice", "Spite", (None, None, 1, 1, 6, 6), {6: {"opp_damage": 1}},
+     "Spite Dice: X, X, 1, 1, 6, 6 - on 6 deal 1 opp damage"),
+    ("InebriationDice", "Inebriation", (None, None, 1, 1, 6, 6), {6: {"self_regret": 1, "opp_neurosis": 1}},
+     "Inebriation Dice: X,X,1,1,6,6 - on 6: take 1 regret to give 1 neurosis"),
+    ("GroundedDice", "Grounded", (None, 1, 2, 3, 4, 4), {},
+     "Grounded Dice: X,1,2,3,4,4 - pair grants echo 1 to the insult (handled at bank time)"),
+    ("NostalgiaDice", "Nostalgia", (None, 1, 2, 3, 4, 4), {},
+     "Nostalgia Dice: X,1,2,3,4,4 - creates echo at banking (handled later)"),
+    ("PenanceDice", "Penance", (1, 2, 3, 4, 5, 6), {},
+     "Penance Dice: 1..6 - on fumble with last roll >=4 doubles incoming damage (handled on fumble)"),
+    ("PilferDice", "Pilfer", (1, 1, 2, 3, 6, 6), {6: {"pilfer_six": 1}},
+     "Pilfer Dice: 1,1,2,3,6,6 - if both pilfers roll 6, steal (handled later)"),
+    ("CatastrophizeDice", "Catastrophize", (1, 3, 4, 6, 6, 6), {1: {"force_fumble": 1}},
+     "Catastrophize Dice: 1,3,4,6,6,6 - on 1 immediate bust; on 6 grants bust-protection (later)"),
+    ("RidiculeDice", "Ridicule", (1, 2, 3, 4, 5, 6), {6: {"ridicule_six": 1}},
+     "Ridicule Dice: 1..6 - on 6: if no regret, gain one; else transfer one to opponent"),
+    ("ApatheticDice", "Apathetic", (None, None, None, 6, 6, 6), {},
+     "Apathetic Dice: X,X,X,6,6,6 - if banked, heal 2 (handled at bank time)"),
+)
+
+# Humors resolved at commit time, in tie-break order, and the die colors that count toward each
+HUMORS: Tuple[str, ...] = ("sanguine", "phlegmatic", "melancholic", "choleric")
+HUMOR_OF_COLOR: Dict[str, int] = {"red": 0, "purple": 0, "green": 1, "blue": 1, "gray": 2, "yellow": 3, "orange": 3}
+
+# Humor dice share one face set and differ by name and color: (class name, display name, color)
+_HUMOR_FACES = (2, 2, 3, 4, 5, 6)
+_HUMOR_SPECS = (
+    ("CholericDie", "Choleric", "yellow"),
+    ("MelancholicDie", "Melancholic", "gray"),
+    ("PhlegmaticDie", "Phlegmatic", "green"),
+    ("SanguineDie", "Sanguine", "red"),
+)
+
+
+def _make_dice_class(class_name: str, name: str, doc: str, base: Type[Dice] = Dice, **attrs: object) -> Type[Dice]:
+    """Build a Dice subclass from class attributes (FACES, EFFECTS, ...); effect keys accumulate by default"""
+    effects = attrs.get("EFFECTS", {})
+    return type(class_name, (base,), {
+        "__doc__": doc,
+        "__module__": __name__,
+        "NAME": name,
+        "NUMERIC_KEYS": base.NUMERIC_KEYS.union(*effects.values()),
+        **attrs,
+    })
+
+
+# Class name -> generated class; exported as module globals below
+_DICE_CLASSES: Dict[str, Type[Dice]] = {}
+for _class_name, _name, _faces, _effects, _doc in _DICE_SPECS:
+    _DICE_CLASSES[_class_name] = _make_dice_class(_class_name, _name, _doc, FACES=_faces, EFFECTS=_effects)
+for _class_name, _name, _color in _HUMOR_SPECS:
+    _DICE_CLASSES[_class_name] = _make_dice_class(_class_name, _name, f"{_name} humor die ({_color})",
+                                                  FACES=_HUMOR_FACES, color=_color, HUMOR=HUMOR_OF_COLOR[_color])
+del _class_name, _name, _faces, _effects, _doc, _color
+
+# Display-name variants keep their base class, so isinstance checks on the base still match
+_DICE_CLASSES["AporicDice"] = _make_dice_class("AporicDice", "Aporic", "Alias of Catastrophize with different display name",
+                                               base=_DICE_CLASSES["CatastrophizeDice"])
+_DICE_CLASSES["NauseaDice"] = _make_dice_class("NauseaDice", "Nausea", "Alias of Ridicule with different display name",
+                                               base=_DICE_CLASSES["RidiculeDice"])
+globals().update(_DICE_CLASSES)
 
 
 class AcedicDice(Dice):
     """Acedic Dice: X,1,2,3,6,6 - on 6 heal 1 and if no regret, take one"""
 
-    def __init__(self):
-        super().__init__([None, 1, 2, 3, 6, 6], "Acedic")
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        if value == 6:
-            add_regret = 1 if getattr(player, "regret_tokens", 0) == 0 else 0
-            eff: Dict[str, Any] = {"heal": 1}
-            if add_regret:
-                eff["self_regret"] = 1
-            return eff
-        return {}
-
-
-class PilferDice(Dice):
-    """Pilfer Dice: 1,1,2,3,6,6 - if both pilfers roll 6, steal (handled later)"""
-
-    def __init__(self):
-        super().__init__([1, 1, 2, 3, 6, 6], "Pilfer")
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        if value == 6:
-            return {"pilfer_six": 1}
-        return {}
-
-
-class CatastrophizeDice(Dice):
-    """Catastrophize Dice: 1,3,4,6,6,6 - on 1 immediate bust; on 6 grants bust-protection (later)"""
-
-    def __init__(self):
-        super().__init__([1, 3, 4, 6, 6, 6], "Catastrophize")
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        if value == 1:
-            return {"force_fumble": 1}
-        return {}
-
-
-class AporicDice(CatastrophizeDice):
-    """Alias of Catastrophize with different display name"""
-
-    def __init__(self):
-        super().__init__()
-        self.name = "Aporic"
-
-
-class RidiculeDice(Dice):
-    """Ridicule Dice: 1..6 - on 6: if no regret, gain one; else transfer one to opponent"""
-
-    def __init__(self):
-        super().__init__([1, 2, 3, 4, 5, 6], "Ridicule")
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        if value == 6:
-            return {"ridicule_six": 1}
-        return {}
-
-
-class NauseaDice(RidiculeDice):
-    def __init__(self):
-        super().__init__()
-        self.name = "Nausea"
-
-
-class CholericDie(Dice):
-    def __init__(self):
-        super().__init__([2, 2, 3, 4, 5, 6], "Choleric")
-        self.color = "yellow"
+    NUMERIC_KEYS = Dice.NUMERIC_KEYS | {"self_regret"}
 
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        return {}
+    FACES = (None, 1, 2, 3, 6, 6)
+    NAME = "Acedic"
+    EFFECTS = {6: {"heal": 1}}
 
-
-class MelancholicDie(Dice):
-    def __init__(self):
-        super().__init__([2, 2, 3, 4, 5, 6], "Melancholic")
-        self.color = "gray"
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        return {}
-
-
-class PhlegmaticDie(Dice):
-    def __init__(self):
-        super().__init__([2, 2, 3, 4, 5, 6], "Phlegmatic")
-        self.color = "green"
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        return {}
-
-
-class SanguineDie(Dice):
-    def __init__(self):
-        super().__init__([2, 2, 3, 4, 5, 6], "Sanguine")
-        self.color = "red"
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        return {}
+    def special_effect(self, value: int, player: object) -> Mapping[str, int]:
+        if value not in self.EFFECTS:
+            return _NO_EFFECT
+        # The regret only comes with the heal while the player holds none
+        if getattr(player, "regret_tokens", 0) == 0:
+            return {"heal": 1, "self_regret": 1}
+        return self.EFFECTS[value]
 
 
 class BlankDice(Dice):
     """Dice with blank faces (X)"""
 
-    def __init__(self, faces: List[int]):
+    NAME = "Blank"
+
+    def __init__(self, faces: Sequence[Optional[int]]) -> None:
         # Replace None with a special marker for blank faces
-        processed_faces = [face if face is not None else -1 for face in faces]
-        super().__init__(processed_faces, "Blank")
+        super().__init__(tuple(face if face is not None else -1 for face in faces))
 
     def can_roll(self) -> bool:
         """Blank dice cannot be rolled"""
         return False
 
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        return {}
-
-
-class ApatheticDice(Dice):
-    """Apathetic Dice: X,X,X,6,6,6 - if banked, heal 2 (handled at bank time)"""
-
-    def __init__(self):
-        super().__init__([None, None, None, 6, 6, 6], "Apathetic")
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        return {}
-
 
 class AbyssalDice(Dice):
     """Abyssal Dice: X,X,X,X,X,X - after banking, can be added copying lowest die (handled at bank time)"""
 
-    def __init__(self):
-        super().__init__([None, None, None, None, None, None], "Abyssal")
-
-    def special_effect(self, value: int, player) -> Dict[str, Any]:
-        return {}
+    FACES = (None, None, None, None, None, None)
+    NAME = "Abyssal"
 
     def get_rules_text(self) -> str:
         return "After banking an insult, this die can be added to it, copying the value of that insult's lowest die"
 
 
+def _highest_with(counts: List[int], k: int) -> int:
+    """Highest face value rolled at least k times (0 if none)"""
+    for v in _FACE_VALUES_DESC:
+        if counts[v] >= k:
+            return v
+    return 0
+
+
+def _highest_straight(mask: int, length: int) -> Optional[Tuple[int, ...]]:
+    """Highest straight of this length in a face mask (bit v-1 set iff v rolled), or None"""
+    pattern = (1 << length) - 1
+    for start in range(6 - length, -1, -1):
+        if (mask >> start) & pattern == pattern:
+            return tuple(range(start + 1, start + 1 + length))
+    return None
+
+
+# A combo as the core returns it: (name, dice, echo_dice)
+PackedCombo = Tuple[str, Tuple[int, ...], int]
+
+# Highest straight of each length for every 6-bit face mask, packed like _best_combo's result
+# (None where the mask holds no straight of that length); built once at import
+_STRAIGHT_LUT: Dict[int, Tuple[Optional[PackedCombo], ...]] = {
+    length: tuple(
+        None if dice is None else (name, dice, echo)
+        for dice in (_highest_straight(mask, length) for mask in range(64))
+    )
+    for length, name, echo in _STRAIGHTS
+}
+
+
+def _best_combo(dice_values: Sequence[int]) -> Optional[PackedCombo]:
+    """Core of combo detection on plain ints (blanks already removed).
+    Returns the best combo packed as (name, dice, echo_dice), or None for an empty pool.
+    Kept free of Combo objects and engine state so it can be compiled or cached as-is.
+    """
+    if not dice_values:
+        return None
+
+    # Histogram of face values; faces are bounded to 1..6 so index 0 stays unused
+    counts = [0] * 7
+    for value in dice_values:
+        counts[value] += 1
+
+    # Score = (len + echo, len, damage). Tiers are tried from the highest reachable score down,
+    # so the first tier that matches holds the answer and nothing below it is enumerated.
+    n = len(dice_values)
+    max_count = max(counts)
+
+    # 6 of a kind (10), then 5 of a kind (8): nothing else reaches 8
+    if max_count >= 6:
+        return ("Astonishing", (_highest_with(counts, 6),) * 6, 4)
+    if max_count == 5:
+        return ("Distressing", (_highest_with(counts, 5),) * 5, 3)
+
+    # Bitmask of the faces present (bit v-1 set iff v rolled), for straights
+    mask = 0
+    for value in _FACE_VALUES:
+        if counts[value]:
+            mask |= 1 << (value - 1)
+
+    # Six-dice tier (7): 6-straight, two triplets, quadruplet + pair all score the same,
+    # so damage decides and the first seen wins an exact tie
+    if n >= 6:
+        best: Optional[PackedCombo] = None
+        best_damage = -1
+
+        def consider(name: str, dice: Tuple[int, ...], echo: int) -> None:
+            nonlocal best, best_damage
+            damage = sum(dice)
+            if damage > best_damage:
+                best_damage = damage
+                best = (name, dice, echo)
+
+        six_straight = _STRAIGHT_LUT[6][mask]
+        if six_straight is not None:
+            consider(*six_straight)
+        if max_count >= 3:
+            # two triplets (Surprising +1)
+            trip_values = [v for v in _FACE_VALUES_DESC if counts[v] >= 3]
+            if len(trip_values) >= 2:
+                consider("Surprising", (trip_values[0],) * 3 + (trip_values[1],) * 3, 1)
+        if max_count >= 4:
+            # quadruplet + pair (Surprising +1)
+            quad_values = [v for v in _FACE_VALUES if counts[v] >= 4]
+            pair_values = [v for v in _FACE_VALUES if counts[v] >= 2]
+            for qv in quad_values:
+                for pv in pair_values:
+                    if pv != qv:
+                        consider("Surprising", (qv,) * 4 + (pv,) * 2, 1)
+        if best is not None:
+            return best
+
+    # 4 of a kind (Shocking +2, 6)
+    if max_count >= 4:
+        return ("Shocking", (_highest_with(counts, 4),) * 4, 2)
+
+    # 5-straight (5), 4-straight (4 with four dice)
+    for length in (5, 4):
+        straight = _STRAIGHT_LUT[length][mask]
+        if straight is not None:
+            return straight
+
+    # single triplet (Surprising +1, 4 with three dice)
+    if max_count >= 3:
+        return ("Surprising", (_highest_with(counts, 3),) * 3, 1)
+
+    # 3-straight (3)
+    straight = _STRAIGHT_LUT[3][mask]
+    if straight is not None:
+        return straight
+
+    # pair (Solid +0) - highest pair
+    if max_count >= 2:
+        return ("Solid", (_highest_with(counts, 2),) * 2, 0)
+
+    # single die (Solid +0) - highest die
+    return ("Solid", (_highest_with(counts, 1),), 0)
+
+
+def _find_combos_impl(key: Tuple[int, ...]) -> Optional[Tuple[str, Tuple[int, ...], int, int]]:
+    """Best combo for a sorted tuple of live values, packed as (name, dice, echo_dice, damage)"""
+    best = _best_combo(key)
+    if best is None:
+        return None
+    name, dice, echo = best
+    return (name, dice, echo, sum(dice))
+
+
+# Solver-level cache: the result only depends on the multiset of values, so overlapping
+# queries from playouts and repeated banking steps hit the same canonical key
+_find_combos_cached = functools.lru_cache(maxsize=8192)(_find_combos_impl)
+
+
 class ComboDetector:
     """Detects and scores dice combinations"""
 
-    @staticmethod
-    def find_combos(dice_values: List[int]) -> List[Combo]:
-        """Find the single best combination using a score = natural dice + echo dice."""
-        dice_values = [d for d in dice_values if d is not None and d != -1]
+    # Fewest live dice that form a combo (a lone die banks as a single); find_combos is [] below this
+    MIN_DICE = 1
 
-        if not dice_values:
+    @staticmethod
+    def find_combos(dice_values: Sequence[int]) -> List[Combo]:
+        """Find the single best combination using a score = natural dice + echo dice.
+        Expects live values only: callers drop blank faces (None / -1) when they build the pool.
+        """
+        if __debug__:
+            assert None not in dice_values and -1 not in dice_values, "find_combos expects blanks filtered out"
+        key = tuple(sorted(dice_values))
+        # Tiny pools are cheaper to solve than to hash and look up
+        best = _find_combos_cached(key) if len(key) >= 3 else _find_combos_impl(key)
+        if best is None:
             return []
-
-        # Count occurrences of each value
-        counts: Dict[int, int] = {}
-        for value in dice_values:
-            counts[value] = counts.get(value, 0) + 1
-
-        candidates: List[Combo] = []
-
-        # 6 of a kind
-        for value, count in counts.items():
-            if count >= 6:
-                candidates.append(Combo("Astonishing", [value] * 6, echo_dice=4))
-
-        # straights helper
-        def add_straights(min_len: int, name: str, echo: int):
-            if len(dice_values) >= min_len:
-                sorted_values = sorted(set(dice_values))
-                for i in range(len(sorted_values) - (min_len - 1)):
-                    if all(sorted_values[i + j] == sorted_values[i] + j for j in range(min_len)):
-                        straight_dice = [sorted_values[i] + j for j in range(min_len)]
-                        candidates.append(Combo(name, straight_dice, echo_dice=echo))
-
-        # 6-straight (Surprising +1)
-        add_straights(6, "Surprising", 1)
-
-        # 5 of a kind
-        for value, count in counts.items():
-            if count >= 5:
-                candidates.append(Combo("Distressing", [value] * 5, echo_dice=3))
-
-        # 5-straight (Solid +0)
-        add_straights(5, "Solid", 0)
-
-        # two triplets (Surprising +1)
-        trip_values = [v for v, c in counts.items() if c >= 3]
-        if len(trip_values) >= 2:
-            trip_values_sorted = sorted(trip_values, reverse=True)[:2]
-            combo_dice = [trip_values_sorted[0]] * 3 + [trip_values_sorted[1]] * 3
-            candidates.append(Combo("Surprising", combo_dice, echo_dice=1))
-
-        # quadruplet + pair (Surprising +1)
-        quad_values = [v for v, c in counts.items() if c >= 4]
-        pair_values = [v for v, c in counts.items() if c >= 2]
-        for qv in quad_values:
-            for pv in pair_values:
-                if pv != qv:
-                    candidates.append(Combo("Surprising", [qv] * 4 + [pv] * 2, echo_dice=1))
-
-        # 4 of a kind (Shocking +2)
-        for value, count in counts.items():
-            if count >= 4:
-                candidates.append(Combo("Shocking", [value] * 4, echo_dice=2))
-
-        # 4-straight, 3-straight
-        add_straights(4, "Solid", 0)
-        add_straights(3, "Solid", 0)
-
-        # single triplet (Surprising +1)
-        for value, count in counts.items():
-            if count >= 3:
-                candidates.append(Combo("Surprising", [value] * 3, echo_dice=1))
-
-        # pairs (Solid +0) - pick all distinct pairs as candidates
-        for value, count in counts.items():
-            if count >= 2:
-                candidates.append(Combo("Solid", [value] * 2, echo_dice=0))
-
-        # single die (Solid +0) - highest die
-        candidates.append(Combo("Solid", [max(dice_values)], echo_dice=0))
-
-        # Score candidates: total dice won = len + echo; break ties by len then damage then higher faces
-        def score(c: Combo) -> Tuple[int, int, int]:
-            return (len(c.dice) + c.echo_dice, len(c.dice), c.damage)
-
-        best = max(candidates, key=score) if candidates else None
-        return [best] if best else []
+        name, dice, echo, damage = best
+        return [Combo(name, list(dice), echo, damage)]
 
     @staticmethod
-    def can_make_combo(dice_values: List[int]) -> bool:
-        """Check if any combo can be made with the given dice"""
+    def can_make_combo(dice_values: Sequence[int]) -> bool:
+        """Check if any combo can be made with the given (live, already filtered) dice"""
         combos = ComboDetector.find_combos(dice_values)
         return len(combos) > 0 and any(combo.name != "Slighting" or len(combo.dice) > 0 for combo in combos)
@@ -2,16 +2,67 @@
 Runtime emotion system: base classes with auto-registry and hooks.
 """
 
-from typing import Dict, Any, List, Optional, Type
+import functools
+import sys
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Any, Callable, FrozenSet, List, Mapping, Optional, Tuple, Type
+from archetypes import TOKEN_INDEX
+from dice import Dice
+
+
+# Canonical token names, interned once; pass these to add_token to skip lowercasing
+_EUREKA = sys.intern('eureka')
+_BREAKTHROUGH = sys.intern('breakthrough')
+_REHASH = sys.intern('rehash')
+_FORGIVENESS = sys.intern('forgiveness')
+_NEUROSIS = sys.intern('neurosis')
+_REGRET = sys.intern('regret')
+_FUMBLE_SHIELD = sys.intern('fumble-shield')
+
+# Token name (as passed to add_token) -> index of its count in Player.tokens; unknown tokens are ignored
+_TOKEN_IDX: Dict[str, int] = {
+    _EUREKA: TOKEN_INDEX['eureka_tokens'],
+    _BREAKTHROUGH: TOKEN_INDEX['breakthrough_tokens'],
+    _REHASH: TOKEN_INDEX['rehash_tokens'],
+    _FORGIVENESS: TOKEN_INDEX['forgiveness_tokens'],
+    _NEUROSIS: TOKEN_INDEX['neurosis_tokens'],
+    _REGRET: TOKEN_INDEX['regret_tokens'],
+    _FUMBLE_SHIELD: TOKEN_INDEX['fumble_shields'],
+}
+
+
+# Shared ctx.data for hooks called without any data
+_EMPTY_DATA: Mapping[str, Any] = MappingProxyType({})
+
+# Faces of a plain d6, for rerolling live dice
+_DIE_FACES = (1, 2, 3, 4, 5, 6)
+
+# Highest (len+echo, len, damage) combo score reachable with 0..6+ live dice: n sixes of a kind
+_MAX_COMBO_SCORE = ((0, 0, 0), (1, 1, 6), (2, 2, 12), (4, 3, 18), (6, 4, 24), (8, 5, 30), (10, 6, 36))
+
+
+def _live_dice(pool) -> List[tuple]:
+    """(index, value, die) for every live die in a pool; blanks are None or -1, live faces are 1-6"""
+    return [(i, v, d) for i, (v, d) in enumerate(pool) if v.__class__ is int and v > 0]
 
 
 class EmotionContext:
-    def __init__(self, engine, self_player, opponent, round_num: int = 0, data: Optional[Dict[str, Any]] = None):
+    __slots__ = ('engine', 'self', 'opponent', 'round_num', 'data')
+
+    def __init__(self, engine, self_player, opponent, round_num: int = 0, data: Optional[Mapping[str, Any]] = None):
         self.engine = engine
         self.self = self_player
         self.opponent = opponent
         self.round_num = round_num
-        self.data = data or {}
+        # Contexts without data share one read-only empty mapping instead of allocating a dict
+        self.data = data if data is not None else _EMPTY_DATA
+
+    def at(self, round_num: int, data: Optional[Mapping[str, Any]] = None) -> 'EmotionContext':
+        """Repoint this context at another round and payload and return it (one context per player per debate)"""
+        self.round_num = round_num
+        self.data = data if data is not None else _EMPTY_DATA
+        return self
 
     # convenience helpers
     def deal_self(self, dmg: int):
@@ -27,38 +78,18 @@ class EmotionContext:
             self.self.heal(amt)
 
     def add_token(self, token: str, amt: int = 1):
-        token = token.lower()
-        if token == 'eureka':
-            self.self.eureka_tokens += amt
-        elif token == 'breakthrough':
-            self.self.breakthrough_tokens += amt
-        elif token == 'rehash':
-            self.self.rehash_tokens += amt
-        elif token == 'forgiveness':
-            self.self.forgiveness_tokens += amt
-        elif token == 'neurosis':
-            self.self.neurosis_tokens += amt
-        elif token == 'regret':
-            self.self.regret_tokens += amt
-        elif token == 'fumble-shield':
-            self.self.fumble_shields += amt
+        idx = _TOKEN_IDX.get(token)
+        if idx is None:
+            idx = _TOKEN_IDX.get(token.lower())
+        if idx is not None:
+            self.self.tokens[idx] += amt
 
     def add_token_opponent(self, token: str, amt: int = 1):
-        token = token.lower()
-        if token == 'eureka':
-            self.opponent.eureka_tokens += amt
-        elif token == 'breakthrough':
-            self.opponent.breakthrough_tokens += amt
-        elif token == 'rehash':
-            self.opponent.rehash_tokens += amt
-        elif token == 'forgiveness':
-            self.opponent.forgiveness_tokens += amt
-        elif token == 'neurosis':
-            self.opponent.neurosis_tokens += amt
-        elif token == 'regret':
-            self.opponent.regret_tokens += amt
-        elif token == 'fumble-shield':
-            self.opponent.fumble_shields += amt
+        idx = _TOKEN_IDX.get(token)
+        if idx is None:
+            idx = _TOKEN_IDX.get(token.lower())
+        if idx is not None:
+            self.opponent.tokens[idx] += amt
 
     def add_totem(self, key: str, payload: Any = True):
         self.self.totems[key] = payload
@@ -70,7 +101,12 @@ class EmotionContext:
 
 _AUTO_REGISTRY: Dict[str, Type["Emotion"]] = {}
 
+# Every hook an Emotion can override
+HOOK_NAMES = ('on_debate_start', 'on_round_start', 'on_after_roll', 'on_bank', 'on_fumble',
+              'on_commit', 'on_clash_end', 'on_debate_end', 'on_trigger')
 
+
+@functools.lru_cache(maxsize=256)
 def _camel_to_title(name: str) -> str:
     out = []
     prev_lower = False
@@ -83,65 +119,59 @@ def _camel_to_title(name: str) -> str:
 
 
 class Emotion:
+    # Subclasses declare their own (usually empty) __slots__ so instances carry no __dict__
+    __slots__ = ()
     rules_text: str = ""
+    # Display name, computed once per class in __init_subclass__
+    _display_name: str = "Emotion"
+    # Names of the hooks this class defines (the rest stay None)
+    HOOKS: FrozenSet[str] = frozenset()
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         if cls.__name__ == 'Emotion':
             return
+        cls._display_name = _camel_to_title(cls.__name__)
+        # Checked once here, so a bad hook fails at import rather than mid-debate
+        for h in HOOK_NAMES:
+            hook = getattr(cls, h)
+            if hook is not None and not callable(hook):
+                raise TypeError(f"{cls.__name__}.{h} must be a method or None, not {type(hook).__name__}")
+        cls.HOOKS = frozenset(h for h in HOOK_NAMES if getattr(cls, h) is not None)
         key_class = cls.__name__.lower()
-        key_title = _camel_to_title(cls.__name__).lower()
+        key_title = cls._display_name.lower()
         _AUTO_REGISTRY[key_class] = cls
         _AUTO_REGISTRY[key_title] = cls
 
     @property
     def name(self) -> str:
-        return _camel_to_title(self.__class__.__name__)
-
-    def on_debate_start(self, ctx: EmotionContext):
-        pass
-
-    def on_round_start(self, ctx: EmotionContext):
-        pass
-
-    def on_after_roll(self, ctx: EmotionContext):
-        pass
-
-    def on_bank(self, ctx: EmotionContext):
-        pass
-
-    def on_fumble(self, ctx: EmotionContext):
-        pass
-
-    def on_commit(self, ctx: EmotionContext):
-        pass
-
-    def on_clash_end(self, ctx: EmotionContext):
-        pass
-
-    def on_debate_end(self, ctx: EmotionContext):
-        pass
+        return self._display_name
 
+    # Hooks are None unless a subclass defines them; callers check for None instead of calling a no-op
+    on_debate_start = on_round_start = on_after_roll = on_bank = on_fumble = None
+    on_commit = on_clash_end = on_debate_end = None
     # explicit trigger
-    def on_trigger(self, ctx: EmotionContext):
-        pass
+    on_trigger = None
 
 
 class Foreboding(Emotion):
+    __slots__ = ()
     rules_text = "When triggered, gain 1 fumble-shield (or convert one to heal 1 + gain 1 rehash)."
 
     def on_trigger(self, ctx: EmotionContext):
         # default: gain a fumble-shield
-        ctx.add_token('fumble-shield', 1)
+        ctx.add_token(_FUMBLE_SHIELD, 1)
 
 
 class Catalepsy(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, choose an opponent live die; make it waxy for this round."
     # Requires selecting an opponent live die to make waxy; engine integration TBD
     pass
 
 
 class Tantrum(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, both players take 1 damage."
 
     def on_trigger(self, ctx: EmotionContext):
@@ -150,65 +180,79 @@ class Tantrum(Emotion):
 
 
 class PersecutoryDelusions(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, you may take 1 Regret; if you do, opponent gains 2 Regret."
 
     def on_trigger(self, ctx: EmotionContext):
-        ctx.add_token('regret', 1)
-        ctx.add_token_opponent('regret', 2)
+        ctx.add_token(_REGRET, 1)
+        ctx.add_token_opponent(_REGRET, 2)
 
 
 class Absolution(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, remove 1 Neurosis from self → +1 Forgiveness; else remove 1 from opponent → +2 Forgiveness."
 
     def on_trigger(self, ctx: EmotionContext):
         if ctx.self.neurosis_tokens > 0:
             ctx.self.neurosis_tokens -= 1
-            ctx.add_token('forgiveness', 1)
+            ctx.add_token(_FORGIVENESS, 1)
         elif ctx.opponent.neurosis_tokens > 0:
             ctx.opponent.neurosis_tokens -= 1
-            ctx.add_token('forgiveness', 2)
+            ctx.add_token(_FORGIVENESS, 2)
 
 
 class CognitiveDissonance(Emotion):
+    __slots__ = ()
     rules_text = "After roll, you may flip one of your live dice to its opposite face."
 
     def on_after_roll(self, ctx: EmotionContext):
         pool = ctx.data.get('pool') or []
         # Evaluate no-flip vs flipping each eligible die; keep the flip that maximizes the best combo score.
-        def extract_vals(p):
-            return [v for (v, _d) in p]
+        # Flips often land on a multiset already scored this decision, so memo scores by sorted values
+        cache: Dict[tuple, tuple] = {}
+        find_combos = ctx.engine.combo_detector.find_combos
 
         def score_for(vals):
             # Use engine's combo detector to evaluate best combo and score by (len+echo, len, damage)
-            combos = ctx.engine.combo_detector.find_combos(vals)
-            if not combos:
-                return (0, 0, 0)
-            c = combos[0]
-            return (len(c.dice) + getattr(c, 'echo_dice', 0), len(c.dice), getattr(c, 'damage', 0))
-
-        base_vals = extract_vals(pool)
-        best_score = score_for(base_vals)
-        best_change = None  # (index, new_val)
-
-        for i, (v, dobj) in enumerate(pool):
-            if isinstance(v, int) and 1 <= v <= 6:
-                flipped = 7 - v
-                if flipped == v:
-                    continue
-                cand_vals = list(base_vals)
-                cand_vals[i] = flipped
-                cand_score = score_for(cand_vals)
-                if cand_score > best_score:
-                    best_score = cand_score
-                    best_change = (i, flipped)
+            key = tuple(sorted(vals))
+            score = cache.get(key)
+            if score is None:
+                combos = find_combos(vals)
+                if not combos:
+                    score = (0, 0, 0)
+                else:
+                    c = combos[0]
+                    n = len(c.dice)
+                    score = (n + c.echo_dice, n, c.damage)
+                cache[key] = score
+            return score
+
+        # One list of live values (blanks left out), flipped in place per candidate and restored
+        live = _live_dice(pool)
+        vals = [v for _i, v, _d in live]
+        best_score = score_for(vals)
+        # Already the best combo this many dice can make (all sixes): no flip can beat it
+        if best_score >= _MAX_COMBO_SCORE[min(len(vals), 6)]:
+            return
+        best_change = None  # (index, new_val, die_obj)
+
+        # Every live die can flip; 7 - v never equals v
+        for j, (i, v, dobj) in enumerate(live):
+            flipped = 7 - v
+            vals[j] = flipped
+            cand_score = score_for(vals)
+            vals[j] = v
+            if cand_score > best_score:
+                best_score = cand_score
+                best_change = (i, flipped, dobj)
 
         if best_change is not None:
-            i, new_v = best_change
-            _old_v, dobj = pool[i]
+            i, new_v, dobj = best_change
             pool[i] = (new_v, dobj)
 
 
 class Outburst(Emotion):
+    __slots__ = ('_counters',)
     rules_text = "On trigger, place a counter; at 3, deal 3 damage to an opponent and reset."
 
     def __init__(self):
@@ -222,15 +266,17 @@ class Outburst(Emotion):
 
 
 class Chivalry(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, immediately commit, gain 1 rehash, and heal 1."
 
     def on_trigger(self, ctx: EmotionContext):
         ctx.self.force_commit = True
-        ctx.add_token('rehash', 1)
+        ctx.add_token(_REHASH, 1)
         ctx.heal_self(1)
 
 
 class MarxistAccelerationism(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, highest health players lose 2; lowest heal 2 (all ties)."
 
     def on_trigger(self, ctx: EmotionContext):
@@ -249,6 +295,7 @@ class MarxistAccelerationism(Emotion):
 
 
 class MasochisticRapture(Emotion):
+    __slots__ = ('_counters',)
     rules_text = "On trigger, self takes 2 damage; at 6 counters, increment your wins by 1 (reset)."
 
     def __init__(self):
@@ -266,60 +313,68 @@ class MasochisticRapture(Emotion):
 
 # Additional emotions
 class Schadenfreude(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, gain 1 Neurosis. Also: when any opponent fumbles, gain 1 Eureka."
     def on_trigger(self, ctx: EmotionContext):
-        ctx.add_token('neurosis', 1)
+        ctx.add_token(_NEUROSIS, 1)
     def on_fumble(self, ctx: EmotionContext):
         if ctx.data.get('opponent_fumbled'):
-            ctx.add_token('eureka', 1)
+            ctx.add_token(_EUREKA, 1)
 
 
 class OppositionalDefiance(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, gain 1 Neurosis. Also: whenever you would take exactly 1 damage, assign it to an opponent instead."
     def on_trigger(self, ctx: EmotionContext):
-        ctx.add_token('neurosis', 1)
+        ctx.add_token(_NEUROSIS, 1)
         ctx.self.totems['deflect_one_damage'] = True
 
 
 class Codependence(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, gain 1 Neurosis. If no totem, place a totem linked to an opponent; if they cause you to lose health, they lose the same and remove the totem."
     def on_trigger(self, ctx: EmotionContext):
-        ctx.add_token('neurosis', 1)
+        ctx.add_token(_NEUROSIS, 1)
         if not ctx.self.totems.get('codependence_active'):
             ctx.self.totems['codependence_active'] = {'target': ctx.opponent.name}
 
 
 class Hypervigilance(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, gain 2 Neurosis and place a totem. While active: on taking damage, you may negate and take that many Regret instead."
     def on_trigger(self, ctx: EmotionContext):
-        ctx.add_token('neurosis', 2)
+        ctx.add_token(_NEUROSIS, 2)
         ctx.self.totems['hypervigilance'] = True
 
 
 class UndueCertainty(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, you may set aside up to 2 live dice; gain 2 Regret."
     def on_trigger(self, ctx: EmotionContext):
-        ctx.add_token('regret', 2)
+        ctx.add_token(_REGRET, 2)
         ctx.self.totems['set_aside_limit'] = 2
 
 
 class SmolderingResentment(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, place a totem: if you deal damage, +2 extra (opponent may remove 1 Regret), then remove totem. If still active next debate end: take 2 damage and gain 1 Regret."
     def on_trigger(self, ctx: EmotionContext):
         ctx.self.totems['smoldering'] = True
 
 
 class PathologicalEnvy(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, if an opponent has more Eureka, steal 1; otherwise gain 1 Neurosis."
     def on_trigger(self, ctx: EmotionContext):
         if ctx.opponent.eureka_tokens > ctx.self.eureka_tokens and ctx.opponent.eureka_tokens > 0:
             ctx.opponent.eureka_tokens -= 1
-            ctx.add_token('eureka', 1)
+            ctx.add_token(_EUREKA, 1)
         else:
-            ctx.add_token('neurosis', 1)
+            ctx.add_token(_NEUROSIS, 1)
 
 
 class IntrusiveThought(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, reroll all live dice next roll; gain 1 Neurosis for any die landing on 1."
     def on_trigger(self, ctx: EmotionContext):
         # mark to reroll all live dice next after-roll
@@ -327,36 +382,37 @@ class IntrusiveThought(Emotion):
     def on_after_roll(self, ctx: EmotionContext):
         if ctx.self.totems.get('intrusive_reroll'):
             pool = ctx.data.get('pool') or []
-            import random as _r
-            for i,(v,dobj) in enumerate(pool):
-                if isinstance(v,int) and 1<=v<=6:
-                    nv = _r.randint(1,6)
-                    pool[i] = (nv,dobj)
-                    if nv == 1:
-                        ctx.add_token('neurosis',1)
+            live = _live_dice(pool)
+            # one batched draw for every live die, then a single neurosis grant for the 1s
+            new_vals = Dice.rng.choices(_DIE_FACES, k=len(live))
+            for (i, _v, dobj), nv in zip(live, new_vals):
+                pool[i] = (nv, dobj)
+            ones = new_vals.count(1)
+            if ones:
+                ctx.add_token(_NEUROSIS, ones)
             ctx.self.totems.pop('intrusive_reroll', None)
 
 
 class Habituation(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, spend 1 Eureka to set a live die to any face (mark waxy), or gain 1 Rehash."
     def on_trigger(self, ctx: EmotionContext):
         if ctx.self.eureka_tokens > 0:
             ctx.self.eureka_tokens -= 1
             # set highest die to 6 and mark waxy
             pool = ctx.data.get('pool') or []
-            best_idx=-1; best_val=-1
-            for i,(v,dobj) in enumerate(pool):
-                if isinstance(v,int) and v>best_val:
-                    best_val=v; best_idx=i
-            if best_idx>=0:
-                v,dobj = pool[best_idx]
+            # first live die with the highest value
+            best = max(_live_dice(pool), key=itemgetter(1), default=None)
+            if best is not None:
+                best_idx, _v, dobj = best
                 pool[best_idx] = (6,dobj)
-                ctx.self.totems['waxy_indices'] = (ctx.self.totems.get('waxy_indices') or set()); ctx.self.totems['waxy_indices'].add(best_idx)
+                ctx.self.totems.setdefault('waxy_indices', set()).add(best_idx)
         else:
-            ctx.add_token('rehash',1)
+            ctx.add_token(_REHASH,1)
 
 
 class Overstimulated(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, remove 1 Rehash to remove 1 token of any other type."
     def on_trigger(self, ctx: EmotionContext):
         if ctx.self.rehash_tokens>0:
@@ -369,18 +425,20 @@ class Overstimulated(Emotion):
 
 
 class Projection(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, transfer 1 token (prefers Neurosis, then Regret, then Forgiveness) to another player."
     def on_trigger(self, ctx: EmotionContext):
         # transfer one token in priority order
         if ctx.self.neurosis_tokens>0:
-            ctx.self.neurosis_tokens-=1; ctx.add_token_opponent('neurosis',1)
+            ctx.self.neurosis_tokens-=1; ctx.add_token_opponent(_NEUROSIS,1)
         elif ctx.self.regret_tokens>0:
-            ctx.self.regret_tokens-=1; ctx.add_token_opponent('regret',1)
+            ctx.self.regret_tokens-=1; ctx.add_token_opponent(_REGRET,1)
         elif ctx.self.forgiveness_tokens>0:
-            ctx.self.forgiveness_tokens-=1; ctx.add_token_opponent('forgiveness',1)
+            ctx.self.forgiveness_tokens-=1; ctx.add_token_opponent(_FORGIVENESS,1)
 
 
 class PlaceboEffect(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, convert all Neurosis to placebo tokens until end of debate, then convert back."
     def on_trigger(self, ctx: EmotionContext):
         # move neurosis to placebo bucket for the round
@@ -394,24 +452,34 @@ class PlaceboEffect(Emotion):
 
 
 class SuperegoShield(Emotion):
+    __slots__ = ()
     rules_text = "On trigger, gain 1 Forgiveness and place a totem with restrictions on spending/removing tokens."
     def on_trigger(self, ctx: EmotionContext):
-        ctx.add_token('forgiveness',1)
+        ctx.add_token(_FORGIVENESS,1)
         ctx.self.totems['superego_shield'] = True
 
 
 # auto-registered via __init_subclass__
 
 
-def create_emotions(names: List[str]) -> List[Emotion]:
-    out: List[Emotion] = []
-    for n in names:
-        key = (n or '').strip().lower()
-        cls = _AUTO_REGISTRY.get(key)
-        if cls:
-            out.append(cls())
-        else:
-            out.append(Emotion())
-    return out
+@functools.lru_cache(maxsize=256)
+def _normalize(name: Optional[str]) -> str:
+    """Registry key for an emotion name (loadouts repeat the same names across games)"""
+    return (name or '').strip().lower()
 
 
+def create_emotions(names: List[str]) -> List[Emotion]:
+    # Unknown names fall back to the no-op base Emotion
+    return [_AUTO_REGISTRY.get(_normalize(n), Emotion)() for n in names]
+
+
+def bound_hooks(emotions: Optional[List[Emotion]]) -> Dict[str, Tuple[Callable[[EmotionContext], Any], ...]]:
+    """Hook name -> bound hook methods of the emotions that define it, in emotion order (empty if none).
+    Raises TypeError for anything that is not a registered Emotion, before the debate starts.
+    """
+    emotions = emotions or ()
+    for e in emotions:
+        cls = type(e)
+        if cls is not Emotion and _AUTO_REGISTRY.get(cls.__name__.lower()) is not cls:
+            raise TypeError(f"{cls.__name__} is not a registered Emotion")
+    return {h: tuple(getattr(e, h) for e in emotions if h in e.HOOKS) for h in HOOK_NAMES}
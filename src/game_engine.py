@@ -4,15 +4,65 @@ Core game engine for Psycho-Dice-Namic
 
 from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import dataclass
+from collections import deque
+from types import MappingProxyType
 import random
 
-from dice import ComboDetector, Combo
-from archetypes import Player, Archetype
-from emotions_runtime import EmotionContext
+from dice import ComboDetector, Combo, Dice, HUMORS
+from archetypes import Player, Archetype, Temperance, Physiognomist
+from emotions_runtime import EmotionContext, bound_hooks
 from dice import HighMindedDice, GroundedDice, NostalgiaDice, PenanceDice, PhlegmaticDie, CholericDie, MelancholicDie, SanguineDie
 
-
-@dataclass
+# Face bitmasks (bit v set for face v) for summarizing a roll's live faces
+_ODD_FACES_MASK = (1 << 1) | (1 << 3) | (1 << 5)
+_EVEN_FACES_MASK = (1 << 2) | (1 << 4) | (1 << 6)
+
+# Read-only on_fumble payloads, shared by every fumble notification
+_SELF_FUMBLED = MappingProxyType({"self_fumbled": True})
+_OPPONENT_FUMBLED = MappingProxyType({"opponent_fumbled": True})
+
+
+def _pilfer_target(pool: List[Tuple[int, object]]) -> Optional[Tuple[int, int, object]]:
+    """(index, value, die) of the highest live die in a pool, the last one on ties; None if no live dice"""
+    best = None
+    for i, (v, d) in enumerate(pool):
+        # Blank faces are None or -1
+        if v.__class__ is int and v > 0 and (best is None or v >= best[1]):
+            best = (i, v, d)
+    return best
+
+
+def _ridicule_transfer(me: Player, opp: Player, _n: int) -> None:
+    """Ridicule six: pass one of your regret tokens to the opponent, or gain one if you have none"""
+    if me.regret_tokens > 0:
+        me.regret_tokens -= 1
+        opp.add_regret_tokens(1)
+    else:
+        me.add_regret_tokens(1)
+
+
+# Round special_effects keys resolved after the clash, as (key, apply(me, opp, amount)) in resolution order;
+# the neurosis damage tick falls between the two tables
+_EFFECTS_BEFORE_NEUROSIS = (
+    ("opp_damage", lambda me, opp, n: opp.take_damage(n)),
+    ("opp_neurosis", lambda me, opp, n: opp.add_neurosis_tokens(n)),
+)
+_EFFECTS_AFTER_NEUROSIS = (
+    ("self_regret", lambda me, opp, n: me.add_regret_tokens(n)),
+    ("ridicule_six", _ridicule_transfer),
+    ("opp_regret", lambda me, opp, n: opp.add_regret_tokens(n)),  # Temperance choleric, from commit stage
+)
+
+# Bank-time rules triggered by the dice of one banked combo, gathered in a single pass
+_BANKED_BUST_GUARD_SIX = 1 << 0   # Catastrophize/Aporic banked on a 6
+_BANKED_HIGH_MINDED_SIX = 1 << 1  # High-minded banked on a 6
+_BANKED_GROUNDED = 1 << 2
+_BANKED_PENANCE_HIGH = 1 << 3     # Penance banked on 4+
+_BANKED_APATHETIC = 1 << 4
+_BANKED_NOSTALGIA = 1 << 5
+
+
+@dataclass(slots=True)
 class RoundResult:
     """Result of a single round"""
     player_name: str
@@ -20,7 +70,7 @@ class RoundResult:
     fumbled: bool
     total_damage: int
     special_effects: Dict[str, Any]
-    initial_live_values: List[int] = None
+    initial_live_values: Optional[List[int]] = None
     insults_banked_count: int = 0
     damage_to_opponent: int = 0
     damage_from_opponent: int = 0
@@ -30,7 +80,7 @@ class RoundResult:
     contained_any_one: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DebateResult:
     """Result of a complete debate"""
     winner: str
@@ -45,14 +95,8 @@ class GameEngine:
         self.combo_detector = ComboDetector()
 
     def roll_dice(self, player: Player) -> List[int]:
-        """Roll all of a player's dice"""
-        results = []
-        for dice in player.dice:
-            if dice.can_roll():
-                results.append(dice.roll())
-            else:
-                results.append(-1)  # Blank face
-        return results
+        """Roll all of a player's dice (blank dice give -1)"""
+        return Dice.roll_many(player.dice)
 
     def _roll_live_pool(self, player: Player, archetype: Archetype) -> Tuple[List[Tuple[int, object]], Dict[str, Any]]:
         """Roll dice, return live pool of (value, die_obj) and on-roll effects"""
@@ -78,56 +122,84 @@ class GameEngine:
         insults: List[Combo] = []
         insult_sources: List[List] = []
         special_effects: Dict[str, Any] = {"heal": 0, "damage": 0, "forgiveness_tokens": 0}
-        # Build a mutable values list
-        live_dice = [v for v, _ in live_pool]
-        initial_values = live_dice.copy()
+        initial_values = [v for v, _ in live_pool]
+        # One pass over the pool builds:
+        #  - live_dice: the live (non-blank) values only, as find_combos expects
+        #  - by_value: die objects queued by face in pool order, so banking takes the first matching die in O(1)
+        #  - face_mask: bit v set for every live face rolled, read by the round-summary flags below
+        live_dice: List[int] = []
+        by_value: Dict[int, deque] = {}
+        face_mask = 0
+        for v, dobj in live_pool:
+            if v is not None and v != -1:
+                live_dice.append(v)
+                queue = by_value.get(v)
+                if queue is None:
+                    by_value[v] = queue = deque()
+                    face_mask |= 1 << v
+                queue.append(dobj)
+        pool_left = len(live_pool)
+        # Abyssal depends on the player's dice, not on what was banked, so check it once per round
+        has_abyssal = any(getattr(d, "name", "") == "Abyssal" for d in getattr(player, "dice", []))
         used_abyssal = False
-        # Banking loop
-        while True:
-            possible_combos = self.combo_detector.find_combos(live_dice)
-            if not possible_combos or all(combo.name == "Slighting" and len(combo.dice) == 0 for combo in possible_combos):
-                # Fumble via banking phase shouldn't happen since we only start when we have dice; treat as break
-                break
-
-            best_combo = max(possible_combos, key=lambda c: c.damage)
+        # Banking loop; any live die makes at least a one-die combo, so it only runs dry with no live dice left
+        while len(live_dice) >= ComboDetector.MIN_DICE:
+            # find_combos already returns only the best-scoring combo
+            best_combo = self.combo_detector.find_combos(live_dice)[0]
             used_sources: List[object] = []
             for die_value in best_combo.dice:
-                idx = next((i for i, (v, dobj) in enumerate(live_pool) if v == die_value), None)
-                if idx is not None:
-                    _, dobj = live_pool.pop(idx)
-                    used_sources.append(dobj)
-                    if die_value in live_dice:
-                        live_dice.remove(die_value)
-
-            # Bank-time effects
-            # Catastrophize/Aporic: if banked a 6, grant bust protection
+                queue = by_value.get(die_value)
+                if queue:
+                    used_sources.append(queue.popleft())
+                    live_dice.remove(die_value)
+                    pool_left -= 1
+
+            # Bank-time effects: one pass over the banked dice collects which rules fire
+            kinds = 0
             for dobj in used_sources:
-                if getattr(dobj, "name", "") in ("Catastrophize", "Aporic") and getattr(dobj, "last_value", None) == 6:
-                    player.bust_protection = True
+                if dobj is None:
+                    continue  # echo die
+                last = dobj.last_value
+                if last == 6:
+                    if dobj.name in ("Catastrophize", "Aporic"):
+                        kinds |= _BANKED_BUST_GUARD_SIX
+                    if isinstance(dobj, HighMindedDice):
+                        kinds |= _BANKED_HIGH_MINDED_SIX
+                if isinstance(dobj, GroundedDice):
+                    kinds |= _BANKED_GROUNDED
+                elif isinstance(dobj, PenanceDice):
+                    if last is not None and last >= 4:
+                        kinds |= _BANKED_PENANCE_HIGH
+                elif isinstance(dobj, NostalgiaDice):
+                    kinds |= _BANKED_NOSTALGIA
+                if dobj.name == "Apathetic":
+                    kinds |= _BANKED_APATHETIC
+            # Catastrophize/Aporic: if banked a 6, grant bust protection
+            if kinds & _BANKED_BUST_GUARD_SIX:
+                player.bust_protection = True
             # High-minded raise
-            from dice import HighMindedDice, GroundedDice, NostalgiaDice, PhlegmaticDie, PenanceDice
-            if any(isinstance(d, HighMindedDice) and getattr(d, "last_value", None) == 6 for d in used_sources):
+            if kinds & _BANKED_HIGH_MINDED_SIX:
                 if len(best_combo.dice) >= 1:
                     best_combo.dice.append(best_combo.dice[-1])
                     best_combo.damage = sum(best_combo.dice)
             # Grounded: if pair, add echo die of 1 into insult
-            if len(best_combo.dice) == 2 and len(set(best_combo.dice)) == 1 and any(isinstance(d, GroundedDice) for d in used_sources):
+            if kinds & _BANKED_GROUNDED and len(best_combo.dice) == 2 and best_combo.dice[0] == best_combo.dice[1]:
                 best_combo.dice.append(1)
                 best_combo.damage = sum(best_combo.dice)
             # Penance: if any banked at value >=4, enable double damage for this debate for this player
-            if any(isinstance(d, PenanceDice) and getattr(d, "last_value", 0) >= 4 for d in used_sources):
+            if kinds & _BANKED_PENANCE_HIGH:
                 player.penance_double_active = True
             # Apathetic: on bank, heal 2
-            if any(getattr(d, "name", "") == "Apathetic" for d in used_sources):
+            if kinds & _BANKED_APATHETIC:
                 healed = player.heal(2)
                 special_effects["heal"] = special_effects.get("heal", 0) + healed
             # Abyssal: after banking, add a copy of lowest die once per round
-            if not used_abyssal and any(getattr(d, "name", "") == "Abyssal" for d in getattr(player, "dice", [])) and best_combo.dice:
+            if not used_abyssal and has_abyssal and best_combo.dice:
                 best_combo.dice.append(min(best_combo.dice))
                 best_combo.damage = sum(best_combo.dice)
                 used_abyssal = True
             # Nostalgia echo -> next roll only
-            for i, dobj in enumerate(used_sources):
+            for i, dobj in enumerate(used_sources if kinds & _BANKED_NOSTALGIA else ()):
                 if isinstance(dobj, NostalgiaDice):
                     echo_val = best_combo.dice[i] if i < len(best_combo.dice) else getattr(dobj, "last_value", 1)
                     if hasattr(player, "pending_echo_values"):
@@ -136,50 +208,13 @@ class GameEngine:
             insults.append(best_combo)
             insult_sources.append(used_sources)
 
-            # Simple AI commit rule
-            if len(insults) >= 2 or len(live_dice) < 4:
+            # Simple AI commit rule (counts every die left in the pool, blanks included)
+            if len(insults) >= 2 or pool_left < 4:
                 break
 
         # Humor commit-time resolution (Temperance/Physiognomist)
-        from archetypes import Temperance, Physiognomist
-        if (isinstance(archetype, Temperance) or isinstance(archetype, Physiognomist)) and insult_sources:
-            humor_sums = {"sanguine": 0, "phlegmatic": 0, "melancholic": 0, "choleric": 0}
-            for combo, sources in zip(insults, insult_sources):
-                for val, dobj in zip(combo.dice, sources + [None] * (len(combo.dice) - len(sources))):
-                    if dobj is None:
-                        continue
-                    color = getattr(dobj, "color", None)
-                    if color in ("red", "purple"):
-                        humor_sums["sanguine"] += val
-                    elif color in ("green", "blue"):
-                        humor_sums["phlegmatic"] += val
-                    elif color == "gray":
-                        humor_sums["melancholic"] += val
-                    elif color in ("yellow", "orange"):
-                        humor_sums["choleric"] += val
-            sorted_humors = sorted(humor_sums.items(), key=lambda kv: kv[1], reverse=True)
-            top_value = sorted_humors[0][1] if sorted_humors else 0
-            chosen = [h for h, v in sorted_humors if v == top_value][:2] if top_value > 0 else []
-            for h in chosen:
-                if h == "sanguine":
-                    player.heal(1)
-                elif h == "melancholic":
-                    special_effects["opp_neurosis"] = special_effects.get("opp_neurosis", 0) + 1
-                elif h == "phlegmatic":
-                    # reroll one phlegmatic die value in-place
-                    done = False
-                    for ci, (combo, sources) in enumerate(zip(insults, insult_sources)):
-                        for si, dobj in enumerate(sources):
-                            if isinstance(dobj, PhlegmaticDie):
-                                new_val = dobj.roll()
-                                combo.dice[si] = new_val
-                                combo.damage = sum(combo.dice)
-                                done = True
-                                break
-                        if done:
-                            break
-                elif h == "choleric":
-                    special_effects["opp_regret"] = special_effects.get("opp_regret", 0) + 2
+        if isinstance(archetype, (Temperance, Physiognomist)) and insult_sources:
+            self._apply_humor_commit(player, insults, insult_sources, special_effects)
 
         total_damage = sum(c.damage for c in insults)
         rr = RoundResult(
@@ -191,159 +226,79 @@ class GameEngine:
             initial_live_values=initial_values,
             insults_banked_count=len(insults),
             echo_summoned_count=0,
-            rolled_only_odds=all((v % 2 == 1) for v in initial_values if isinstance(v,int) and v>0),
-            rolled_only_evens=all((v % 2 == 0) for v in initial_values if isinstance(v,int) and v>0),
-            contained_any_one=any(v==1 for v in initial_values)
+            rolled_only_odds=not face_mask & _EVEN_FACES_MASK,
+            rolled_only_evens=not face_mask & _ODD_FACES_MASK,
+            contained_any_one=bool(face_mask & (1 << 1))
         )
         return rr
 
-    def play_round(self, player: Player, archetype: Archetype) -> RoundResult:
-        """Play a single round for a player"""
-        insults: List[Combo] = []
-        insult_sources: List[List] = []  # parallel to insults: list of die objects used per insult
-        values = self.roll_dice(player)
-        # Build live pool (value, die_obj). Echo dice will use die_obj=None
-        live_pool: List[Tuple[int, object]] = [(values[i], player.dice[i]) for i in range(len(values))]
-        live_dice = values.copy()
-        special_effects: Dict[str, Any] = {"heal": 0, "damage": 0, "forgiveness_tokens": 0}
-
-        while True:
-            # Find all possible combos
-            possible_combos = self.combo_detector.find_combos(live_dice)
-
-            # If no combos possible, fumble
-            if not possible_combos or all(combo.name == "Slighting" and len(combo.dice) == 0 for combo in possible_combos):
-                # Apply regret tokens on fumble
-                if player.regret_tokens > 0:
-                    player.take_damage(player.regret_tokens)
-                    player.regret_tokens = 0
-                return RoundResult(
-                    player_name=player.name,
-                    insults=[],
-                    fumbled=True,
-                    total_damage=0,
-                    special_effects=special_effects
-                )
-
-            # For now, always take the best combo (highest damage)
-            best_combo = max(possible_combos, key=lambda c: c.damage)
-
-            # Map combo dice to actual dice objects and remove from pools
-            used_sources: List[object] = []
-            for die_value in best_combo.dice:
-                # find first matching value in live_pool
-                idx = next((i for i,(v,dobj) in enumerate(live_pool) if v == die_value), None)
-                if idx is not None:
-                    val, dobj = live_pool.pop(idx)
-                    used_sources.append(dobj)
-                    # remove one occurrence from live_dice
-                    if die_value in live_dice:
-                        live_dice.remove(die_value)
-
-            # Bank-time effects
-            # Catastrophize: if any Catastrophize die banked a 6, grant bust protection
-            for dobj in used_sources:
-                if getattr(dobj, "name", "") == "Catastrophize" and getattr(dobj, "last_value", None) == 6:
-                    player.bust_protection = True
-            # High-minded: if a 6 from HighMinded die was banked, raise group by adding another same value
-            if any(isinstance(d, HighMindedDice) and getattr(d, "last_value", None) == 6 for d in used_sources):
-                if len(best_combo.dice) >= 1:
-                    best_combo.dice.append(best_combo.dice[-1])
-                    best_combo.damage = sum(best_combo.dice)
-            # Simpleton: if combo is a pair and includes Simpleton die, raise to triplet
-            if len(best_combo.dice) == 2 and len(set(best_combo.dice)) == 1 and any(isinstance(d, SimpletonsDice) for d in used_sources):
-                best_combo.dice.append(best_combo.dice[0])
-                best_combo.damage = sum(best_combo.dice)
-            # Nostalgia: create echo die of same value for each Nostalgia die used (persists to next selection)
-            for i, dobj in enumerate(used_sources):
-                if isinstance(dobj, NostalgiaDice):
-                    echo_val = best_combo.dice[i] if i < len(best_combo.dice) else getattr(dobj, "last_value", 1)
-                    live_pool.append((echo_val, None))
-                    live_dice.append(echo_val)
-
-            insults.append(best_combo)
-            insult_sources.append(used_sources)
-
-            # Add echo dice
-            for _ in range(best_combo.echo_dice):
-                live_dice.append(1)  # Echo dice are always 1s
-
-            # Apply special effects from this roll
-            round_effects = archetype.apply_special_effects(player, [v for v,_ in live_pool])
-            # Immediate effects
-            if round_effects.get("heal", 0) > 0:
-                player.heal(round_effects.get("heal", 0))
-            if round_effects.get("damage", 0) > 0:
-                player.take_damage(round_effects.get("damage", 0))
-            if round_effects.get("forgiveness_tokens", 0) > 0:
-                player.forgiveness_tokens += round_effects.get("forgiveness_tokens", 0)
-            # Acedic adds regret if healed on 6 and had 0 regret
-            for k in ("opp_damage", "opp_neurosis", "self_regret", "force_fumble", "ridicule_six", "pilfer_six"):
-                if round_effects.get(k):
-                    special_effects[k] = special_effects.get(k, 0) + round_effects.get(k)
-
-            # Simple AI: commit if we have good combos or few dice left
-            # Commit when we have fewer than 4 live dice remaining
-            if round_effects.get("force_fumble") and not getattr(player, "bust_protection", False):
-                break
-            if len(insults) >= 2 or len(live_dice) < 4:
-                break
-
-        # Temperance commit-time humor resolution
-        from archetypes import Temperance
-        if isinstance(archetype, Temperance) and insult_sources:
-            humor_sums = {"sanguine":0, "phlegmatic":0, "melancholic":0, "choleric":0}
-            # compute sums based on banked dice and their values
-            for combo, sources in zip(insults, insult_sources):
-                for val, dobj in zip(combo.dice, sources + [None]*(len(combo.dice)-len(sources))):
-                    if dobj is None:
-                        continue
-                    color = getattr(dobj, "color", None)
-                    if color in ("red", "purple"):
-                        humor_sums["sanguine"] += val
-                    elif color in ("green", "blue"):
-                        humor_sums["phlegmatic"] += val
-                    elif color == "gray":
-                        humor_sums["melancholic"] += val
-                    elif color in ("yellow", "orange"):
-                        humor_sums["choleric"] += val
-            # pick top humors
-            sorted_humors = sorted(humor_sums.items(), key=lambda kv: kv[1], reverse=True)
-            top_value = sorted_humors[0][1] if sorted_humors else 0
-            chosen = [h for h,v in sorted_humors if v == top_value][:2] if top_value>0 else []
-            for h in chosen:
-                if h == "sanguine":
-                    special_effects["heal"] = special_effects.get("heal",0) + 1
-                    player.heal(1)
-                elif h == "melancholic":
-                    special_effects["opp_neurosis"] = special_effects.get("opp_neurosis",0) + 1
-                elif h == "phlegmatic":
-                    # reroll one phlegmatic die value in-place
-                    done = False
-                    for ci,(combo,sources) in enumerate(zip(insults, insult_sources)):
-                        for si,dobj in enumerate(sources):
-                            if isinstance(dobj, PhlegmaticDie):
-                                new_val = dobj.roll()
-                                combo.dice[si] = new_val
-                                combo.damage = sum(combo.dice)
-                                done = True
-                                break
-                        if done:
+    def _apply_humor_commit(self, player: Player, insults: List[Combo], insult_sources: List[List],
+                            special_effects: Dict[str, Any]) -> None:
+        """Sum banked values by humor color and apply the top (up to two tied) humor effects"""
+        humor_sums = [0] * len(HUMORS)
+        for combo, sources in zip(insults, insult_sources):
+            # zip stops at the shorter list, so echo dice with no source are skipped
+            for val, dobj in zip(combo.dice, sources):
+                if dobj is not None and dobj.HUMOR >= 0:
+                    humor_sums[dobj.HUMOR] += val
+        top_value = max(humor_sums)
+        chosen = [h for h, v in zip(HUMORS, humor_sums) if v == top_value][:2] if top_value > 0 else []
+        for h in chosen:
+            if h == "sanguine":
+                player.heal(1)
+            elif h == "melancholic":
+                special_effects["opp_neurosis"] = special_effects.get("opp_neurosis", 0) + 1
+            elif h == "phlegmatic":
+                # reroll one phlegmatic die value in-place
+                done = False
+                for ci, (combo, sources) in enumerate(zip(insults, insult_sources)):
+                    for si, dobj in enumerate(sources):
+                        if isinstance(dobj, PhlegmaticDie):
+                            new_val = dobj.roll()
+                            combo.dice[si] = new_val
+                            combo.damage = sum(combo.dice)
+                            done = True
                             break
-                elif h == "choleric":
-                    special_effects["opp_regret"] = special_effects.get("opp_regret",0) + 2
-
-        # Calculate total damage
-        total_damage = sum(combo.damage for combo in insults)
-
+                    if done:
+                        break
+            elif h == "choleric":
+                special_effects["opp_regret"] = special_effects.get("opp_regret", 0) + 2
+
+    def _fumbled_round(self, player: Player) -> RoundResult:
+        """Apply regret damage for a fumble and return the empty round result"""
+        if player.regret_tokens > 0:
+            player.take_damage(player.regret_tokens)
+            player.regret_tokens = 0
         return RoundResult(
             player_name=player.name,
-            insults=insults,
-            fumbled=False,
-            total_damage=total_damage,
-            special_effects=special_effects
+            insults=[],
+            fumbled=True,
+            total_damage=0,
+            special_effects={},
+            initial_live_values=[],
+            insults_banked_count=0,
+            damage_to_opponent=0,
+            damage_from_opponent=0,
+            echo_summoned_count=0,
+            rolled_only_odds=False,
+            rolled_only_evens=False,
+            contained_any_one=False
         )
 
+    def play_round(self, player: Player, archetype: Archetype) -> RoundResult:
+        """Play a single round for a player: roll, then bank the same way a debate round does"""
+        live_pool, round_effects = self._roll_live_pool(player, archetype)
+        live_dice = [v for v, _ in live_pool if v is not None and v != -1]
+        if (round_effects.get("force_fumble") and not player.bust_protection) \
+                or len(live_dice) < ComboDetector.MIN_DICE:
+            return self._fumbled_round(player)
+        result = self._bank_from_live_pool(player, archetype, live_pool)
+        # On-roll effects aimed at the opponent are left for the caller to resolve
+        for k in ("opp_damage", "opp_neurosis", "self_regret", "ridicule_six", "pilfer_six"):
+            if round_effects.get(k):
+                result.special_effects[k] = result.special_effects.get(k, 0) + round_effects[k]
+        return result
+
     def calculate_damage(self, attacker_insults: List[Combo], defender_insults: List[Combo]) -> int:
         """Calculate damage after blocking using optimal greedy matching.
         Matches each smallest attacking die with the smallest defending die that can block it.
@@ -351,53 +306,52 @@ class GameEngine:
         # Collect all attacking dice
         attacking_dice = []
         for insult in attacker_insults:
-            attacking_dice.extend(insult.dice)
+            attacking_dice += insult.dice
+        # Nothing to block with (fumbled defender): every attacking die lands
+        if not defender_insults:
+            return sum(attacking_dice)
 
         # Collect all defending dice
         defending_dice = []
         for insult in defender_insults:
-            defending_dice.extend(insult.dice)
+            defending_dice += insult.dice
 
         # Sort both lists ascending
         attacking_dice.sort()
         defending_dice.sort()
 
-        # Two-pointer sweep to block attacks with the smallest sufficient defender
-        unblocked_damage = 0
-        i = 0  # index for attacking_dice
+        # Two-pointer sweep to block attacks with the smallest sufficient defender.
+        # Defenders only run out once, so every attack from that point on is unblocked.
         j = 0  # index for defending_dice
-        while i < len(attacking_dice):
-            attack_die = attacking_dice[i]
+        num_defenders = len(defending_dice)
+        for i, attack_die in enumerate(attacking_dice):
             # Advance defender pointer until we find a defender that can block
-            while j < len(defending_dice) and defending_dice[j] < attack_die:
+            while j < num_defenders and defending_dice[j] < attack_die:
                 j += 1
-            if j < len(defending_dice):
-                # defender_dice[j] blocks attack_die; consume defender
-                j += 1
-            else:
-                # No defender can block; add damage
-                unblocked_damage += attack_die
-            i += 1
+            if j == num_defenders:
+                return sum(attacking_dice[i:])
+            # defending_dice[j] blocks attack_die; consume defender
+            j += 1
 
-        return unblocked_damage
+        return 0
 
     def play_debate(self, player1: Player, archetype1: Archetype,
                    player2: Player, archetype2: Archetype,
                    max_rounds: int = 5) -> DebateResult:
         """Play a complete debate between two players"""
         rounds = []
+        # Each player's emotion hooks, bound once per debate; a hook error propagates instead of being swallowed
+        hooks1 = bound_hooks(player1.emotions)
+        hooks2 = bound_hooks(player2.emotions)
+        # One context per player, repointed at each round and payload before its hooks run
+        ctx1 = EmotionContext(self, player1, player2, 0)
+        ctx2 = EmotionContext(self, player2, player1, 0)
 
         # Emotion: debate start hooks
-        for emo in (getattr(player1, 'emotions', []) or []):
-            try:
-                emo.on_debate_start(EmotionContext(self, player1, player2, 0, {}))
-            except Exception:
-                pass
-        for emo in (getattr(player2, 'emotions', []) or []):
-            try:
-                emo.on_debate_start(EmotionContext(self, player2, player1, 0, {}))
-            except Exception:
-                pass
+        for hook in hooks1["on_debate_start"]:
+            hook(ctx1)
+        for hook in hooks2["on_debate_start"]:
+            hook(ctx2)
 
         for round_num in range(max_rounds):
             # Joint round: roll both, handle pilfer stealing, then bank
@@ -405,16 +359,14 @@ class GameEngine:
             pool2, effects2 = self._roll_live_pool(player2, archetype2)
 
             # Emotion: after roll hooks
-            for emo in (getattr(player1, 'emotions', []) or []):
-                try:
-                    emo.on_after_roll(EmotionContext(self, player1, player2, round_num, {"pool": pool1}))
-                except Exception:
-                    pass
-            for emo in (getattr(player2, 'emotions', []) or []):
-                try:
-                    emo.on_after_roll(EmotionContext(self, player2, player1, round_num, {"pool": pool2}))
-                except Exception:
-                    pass
+            if hooks1["on_after_roll"]:
+                ctx1.at(round_num, {"pool": pool1})
+                for hook in hooks1["on_after_roll"]:
+                    hook(ctx1)
+            if hooks2["on_after_roll"]:
+                ctx2.at(round_num, {"pool": pool2})
+                for hook in hooks2["on_after_roll"]:
+                    hook(ctx2)
 
             # Catastrophize immediate bust
             fumble1 = bool(effects1.get("force_fumble") and not getattr(player1, "bust_protection", False))
@@ -422,16 +374,16 @@ class GameEngine:
 
             # Pilfer: deferred steal from previous round at start of this round
             if getattr(player1, "pending_pilfer_next_round", False) and pool2:
-                cands2 = [(i, v, d) for i, (v, d) in enumerate(pool2) if isinstance(v, int) and v > 0]
-                if cands2:
-                    idx, val, dobj = sorted(cands2, key=lambda x: x[1])[-1]
+                target = _pilfer_target(pool2)
+                if target is not None:
+                    idx, val, dobj = target
                     pool2.pop(idx)
                     pool1.append((val, dobj))
                 player1.pending_pilfer_next_round = False
             if getattr(player2, "pending_pilfer_next_round", False) and pool1:
-                cands1 = [(i, v, d) for i, (v, d) in enumerate(pool1) if isinstance(v, int) and v > 0]
-                if cands1:
-                    idx, val, dobj = sorted(cands1, key=lambda x: x[1])[-1]
+                target = _pilfer_target(pool1)
+                if target is not None:
+                    idx, val, dobj = target
                     pool1.pop(idx)
                     pool2.append((val, dobj))
                 player2.pending_pilfer_next_round = False
@@ -446,68 +398,30 @@ class GameEngine:
                 round1 = self._bank_from_live_pool(player1, archetype1, pool1)
             else:
                 # Emotion: notify self/opponent fumble
-                for emo in (getattr(player1, 'emotions', []) or []):
-                    try:
-                        emo.on_fumble(EmotionContext(self, player1, player2, round_num, {"self_fumbled": True}))
-                    except Exception:
-                        pass
-                for emo in (getattr(player2, 'emotions', []) or []):
-                    try:
-                        emo.on_fumble(EmotionContext(self, player2, player1, round_num, {"opponent_fumbled": True}))
-                    except Exception:
-                        pass
+                if hooks1["on_fumble"]:
+                    ctx1.at(round_num, _SELF_FUMBLED)
+                    for hook in hooks1["on_fumble"]:
+                        hook(ctx1)
+                if hooks2["on_fumble"]:
+                    ctx2.at(round_num, _OPPONENT_FUMBLED)
+                    for hook in hooks2["on_fumble"]:
+                        hook(ctx2)
                 # Apply regret damage on fumble now
-                if player1.regret_tokens > 0:
-                    player1.take_damage(player1.regret_tokens)
-                    player1.regret_tokens = 0
-                round1 = RoundResult(
-                    player_name=player1.name,
-                    insults=[],
-                    fumbled=True,
-                    total_damage=0,
-                    special_effects={},
-                    initial_live_values=[],
-                    insults_banked_count=0,
-                    damage_to_opponent=0,
-                    damage_from_opponent=0,
-                    echo_summoned_count=0,
-                    rolled_only_odds=False,
-                    rolled_only_evens=False,
-                    contained_any_one=False
-                )
+                round1 = self._fumbled_round(player1)
 
             if not fumble2:
                 round2 = self._bank_from_live_pool(player2, archetype2, pool2)
             else:
                 # Emotion: notify self/opponent fumble
-                for emo in (getattr(player2, 'emotions', []) or []):
-                    try:
-                        emo.on_fumble(EmotionContext(self, player2, player1, round_num, {"self_fumbled": True}))
-                    except Exception:
-                        pass
-                for emo in (getattr(player1, 'emotions', []) or []):
-                    try:
-                        emo.on_fumble(EmotionContext(self, player1, player2, round_num, {"opponent_fumbled": True}))
-                    except Exception:
-                        pass
-                if player2.regret_tokens > 0:
-                    player2.take_damage(player2.regret_tokens)
-                    player2.regret_tokens = 0
-                round2 = RoundResult(
-                    player_name=player2.name,
-                    insults=[],
-                    fumbled=True,
-                    total_damage=0,
-                    special_effects={},
-                    initial_live_values=[],
-                    insults_banked_count=0,
-                    damage_to_opponent=0,
-                    damage_from_opponent=0,
-                    echo_summoned_count=0,
-                    rolled_only_odds=False,
-                    rolled_only_evens=False,
-                    contained_any_one=False
-                )
+                if hooks2["on_fumble"]:
+                    ctx2.at(round_num, _SELF_FUMBLED)
+                    for hook in hooks2["on_fumble"]:
+                        hook(ctx2)
+                if hooks1["on_fumble"]:
+                    ctx1.at(round_num, _OPPONENT_FUMBLED)
+                    for hook in hooks1["on_fumble"]:
+                        hook(ctx1)
+                round2 = self._fumbled_round(player2)
 
             rounds.extend([round1, round2])
 
@@ -526,13 +440,12 @@ class GameEngine:
             if not round1.fumbled and not round2.fumbled:
                 damage1_to_2 = self.calculate_damage(round1.insults, round2.insults)
                 damage2_to_1 = self.calculate_damage(round2.insults, round1.insults)
-                # Penance: if active, double both directions for that player
-                if getattr(player1, "penance_double_active", False):
-                    damage1_to_2 *= 2
-                    damage2_to_1 *= 2
-                if getattr(player2, "penance_double_active", False):
-                    damage1_to_2 *= 2
-                    damage2_to_1 *= 2
+                # Penance: each active player doubles both directions, so two active players quadruple
+                # the clash; per-round damage is recomputed each round, so this never compounds
+                multiplier = (2 if player1.penance_double_active else 1) * (2 if player2.penance_double_active else 1)
+                if multiplier != 1:
+                    damage1_to_2 *= multiplier
+                    damage2_to_1 *= multiplier
 
                 player2.take_damage(damage1_to_2)
                 player1.take_damage(damage2_to_1)
@@ -543,7 +456,7 @@ class GameEngine:
             elif round1.fumbled and not round2.fumbled:
                 # Only player2 attacks
                 damage2_to_1 = self.calculate_damage(round2.insults, [])
-                if getattr(player2, "penance_double_active", False):
+                if player2.penance_double_active:
                     damage2_to_1 *= 2
                 player1.take_damage(damage2_to_1)
                 damage1_to_2 = 0
@@ -551,7 +464,7 @@ class GameEngine:
                 round1.damage_from_opponent = damage2_to_1
             elif round2.fumbled and not round1.fumbled:
                 damage1_to_2 = self.calculate_damage(round1.insults, [])
-                if getattr(player1, "penance_double_active", False):
+                if player1.penance_double_active:
                     damage1_to_2 *= 2
                 player2.take_damage(damage1_to_2)
                 damage2_to_1 = 0
@@ -560,95 +473,55 @@ class GameEngine:
             else:
                 damage1_to_2 = damage2_to_1 = 0
 
-                # After clash token processing (neurosis and forgiveness)
-                if round1.special_effects.get("opp_damage", 0) > 0:
-                    player2.take_damage(round1.special_effects["opp_damage"])
-                if round2.special_effects.get("opp_damage", 0) > 0:
-                    player1.take_damage(round2.special_effects["opp_damage"])
-
-                if round1.special_effects.get("opp_neurosis", 0) > 0:
-                    player2.add_neurosis_tokens(round1.special_effects["opp_neurosis"])
-                if round2.special_effects.get("opp_neurosis", 0) > 0:
-                    player1.add_neurosis_tokens(round2.special_effects["opp_neurosis"])
+                # After clash token processing (neurosis and forgiveness); keyed effects resolve
+                # in table order, player 1 before player 2 for each key
+                sides = ((round1.special_effects, player1, player2), (round2.special_effects, player2, player1))
+                for key, apply in _EFFECTS_BEFORE_NEUROSIS:
+                    for effects, me, opp in sides:
+                        n = effects.get(key, 0)
+                        if n > 0:
+                            apply(me, opp, n)
 
                 if player1.neurosis_tokens > 0:
                     player1.take_damage(1)
-                    player1.neurosis_tokens = max(0, player1.neurosis_tokens - 1)
+                    player1.neurosis_tokens -= 1
                 if player2.neurosis_tokens > 0:
                     player2.take_damage(1)
-                    player2.neurosis_tokens = max(0, player2.neurosis_tokens - 1)
-
-                if round1.special_effects.get("self_regret", 0) > 0:
-                    player1.add_regret_tokens(round1.special_effects["self_regret"])
-                if round2.special_effects.get("self_regret", 0) > 0:
-                    player2.add_regret_tokens(round2.special_effects["self_regret"])
-
-                # Ridicule transfer: if player has regret, transfer to opp else gain one
-                if round1.special_effects.get("ridicule_six"):
-                    if player1.regret_tokens > 0:
-                        player1.regret_tokens -= 1
-                        player2.add_regret_tokens(1)
-                    else:
-                        player1.add_regret_tokens(1)
-                if round2.special_effects.get("ridicule_six"):
-                    if player2.regret_tokens > 0:
-                        player2.regret_tokens -= 1
-                        player1.add_regret_tokens(1)
-                    else:
-                        player2.add_regret_tokens(1)
-
-                # Temperance choleric opp_regret from commit stage
-                if round1.special_effects.get("opp_regret",0) > 0:
-                    player2.add_regret_tokens(round1.special_effects["opp_regret"])
-                if round2.special_effects.get("opp_regret",0) > 0:
-                    player1.add_regret_tokens(round2.special_effects["opp_regret"])
+                    player2.neurosis_tokens -= 1
+
+                for key, apply in _EFFECTS_AFTER_NEUROSIS:
+                    for effects, me, opp in sides:
+                        n = effects.get(key, 0)
+                        if n > 0:
+                            apply(me, opp, n)
 
                 if player1.forgiveness_tokens > 0:
                     player1.heal(1)
-                    player1.forgiveness_tokens = max(0, player1.forgiveness_tokens - 1)
+                    player1.forgiveness_tokens -= 1
                 if player2.forgiveness_tokens > 0:
                     player2.heal(1)
-                    player2.forgiveness_tokens = max(0, player2.forgiveness_tokens - 1)
+                    player2.forgiveness_tokens -= 1
 
-            # Check for winner (handle simultaneous KO as tie)
-            if player1.health <= 0 and player2.health <= 0:
-                return DebateResult(
-                    winner="Tie",
-                    rounds=rounds,
-                    final_health={player1.name: player1.health, player2.name: player2.health}
-                )
-            if player1.health <= 0:
+            # Check for winner: bit 0 when player 1 is knocked out, bit 1 for player 2; both is a tie
+            ko = (player1.health <= 0) | (player2.health <= 0) << 1
+            if ko:
                 return DebateResult(
-                    winner=player2.name,
-                    rounds=rounds,
-                    final_health={player1.name: player1.health, player2.name: player2.health}
-                )
-            if player2.health <= 0:
-                return DebateResult(
-                    winner=player1.name,
+                    winner=(None, player2.name, player1.name, "Tie")[ko],
                     rounds=rounds,
                     final_health={player1.name: player1.health, player2.name: player2.health}
                 )
 
         # Emotion: debate end hooks
-        for emo in (getattr(player1, 'emotions', []) or []):
-            try:
-                emo.on_debate_end(EmotionContext(self, player1, player2, max_rounds, {}))
-            except Exception:
-                pass
-        for emo in (getattr(player2, 'emotions', []) or []):
-            try:
-                emo.on_debate_end(EmotionContext(self, player2, player1, max_rounds, {}))
-            except Exception:
-                pass
-
-        # Determine winner by health
-        if player1.health > player2.health:
-            winner = player1.name
-        elif player2.health > player1.health:
-            winner = player2.name
-        else:
-            winner = "Tie"
+        ctx1.at(max_rounds)
+        ctx2.at(max_rounds)
+        for hook in hooks1["on_debate_end"]:
+            hook(ctx1)
+        for hook in hooks2["on_debate_end"]:
+            hook(ctx2)
+
+        # Determine winner by health: index 1 when player 1 leads, 2 when player 2 does, 0 when level
+        lead = (player1.health > player2.health) | (player2.health > player1.health) << 1
+        winner = ("Tie", player1.name, player2.name)[lead]
 
         # Clear per-debate tokens (neurosis and forgiveness) per rules
         player1.neurosis_tokens = 0
@@ -663,7 +536,7 @@ class GameEngine:
         )
 
     def play_hand_vs_hand(self, hand1: List[int], hand2: List[int]) -> Dict[str, Any]:
-        """Simulate a single hand vs hand comparison"""
+        """Simulate a single hand vs hand comparison (hands hold live values only, no blanks)"""
         # Find combos for both hands
         combos1 = self.combo_detector.find_combos(hand1)
         combos2 = self.combo_detector.find_combos(hand2)
@@ -7,6 +7,9 @@ import os
 import sys
 import json
 import argparse
+import functools
+import heapq
+from operator import itemgetter
 yaml = None
 HAS_YAML = False
 from pathlib import Path
@@ -33,6 +36,9 @@ from archetypes import (
 from simulators import ArchetypeSimulator, HandTester, DefenseSimulator
 from simulators import SynergySimulator, BiasEmotionSimulator
 
+# One engine shared by every stage, so per-process caches (find_combos) stay warm between them
+ENGINE = GameEngine()
+
 
 def render_markdown_html(md_text: str) -> str:
     """Render Markdown to HTML using python-markdown with standard extensions."""
@@ -40,8 +46,9 @@ def render_markdown_html(md_text: str) -> str:
     return markdown(md_text or "", extensions=["extra", "sane_lists", "nl2br"])  # type: ignore
 
 
+@functools.lru_cache(maxsize=None)
 def setup_templates():
-    """Setup Jinja2 environment"""
+    """Setup Jinja2 environment (one per process; it keeps its compiled templates cached across report runs)"""
     template_dir = Path(__file__).parent.parent / "templates"
     return Environment(loader=FileSystemLoader(template_dir))
 
@@ -291,7 +298,7 @@ def build_card_data_defense() -> list:
     bias_md_split = load_bias_markdown_rules()
     cards = []
     for name, faces in DEFENSE_DICE_DEFINITIONS.items():
-        psych_html = (bias_md_split.get(name, {}) or {}).get("psychological") or f"<small>Faces: {faces}</small>"
+        psych_html = (bias_md_split.get(name, {}) or {}).get("psychological") or f"<small>Faces: {list(faces)}</small>"
         som_html = (bias_md_split.get(name, {}) or {}).get("somatic") or ""
         cards.append({
             "name": name,
@@ -324,21 +331,20 @@ def build_card_data_emotions() -> list:
     else:
         for e in EMOTION_DEFINITIONS:
             cards.append({
-                "name": e["name"],
+                "name": e.name,
                 "subtitle": "Emotion",
                 "type": "emotion",
-                "rules_html": render_markdown_html(e["markdown"]),
+                "rules_html": render_markdown_html(e.markdown),
                 "quote": "",
-                "image_src": f"../assets/{slugify(e['name'])}.svg",
+                "image_src": f"../assets/{slugify(e.name)}.svg",
             })
     return cards
 
 
-def run_archetype_simulation():
+def run_archetype_simulation(game_engine: GameEngine = ENGINE):
     """Run archetype vs archetype simulation"""
     print("🎲 Running Archetype vs Archetype Simulation...")
 
-    game_engine = GameEngine()
     simulator = ArchetypeSimulator(game_engine)
 
     # Create archetypes
@@ -355,11 +361,10 @@ def run_archetype_simulation():
 
     save_data("archetypes_testing_pair", results)
     return results
-def run_archetype_tournament():
+def run_archetype_tournament(game_engine: GameEngine = ENGINE):
     """Run a tournament across all archetypes and aggregate win/tie rates per archetype"""
     print("🎲 Running Archetype Tournament...")
 
-    game_engine = GameEngine()
     simulator = ArchetypeSimulator(game_engine)
 
     archetypes = [
@@ -367,24 +372,16 @@ def run_archetype_tournament():
         Transcendentalist(), Puritan(), Machiavalian(), Absurdist(), Stoic(), Nihilist()
     ]
 
-    tresults = simulator.simulate_tournament(archetypes, matches_per_pair=5000)
+    # Pairings are independent, so spread them over every core
+    tresults = simulator.simulate_tournament(archetypes, matches_per_pair=5000, processes=os.cpu_count() or 1)
 
-    # Aggregate per-arch wins, ties, matches
-    arch_stats = {}
+    # Per-arch win/tie rates and match counts, already totalled by the simulator
     names = [a.name for a in archetypes]
-    for a in names:
-        wins = ties = matches = 0
-        for b in names:
-            if a == b:
-                continue
-            if a in tresults["match_results"] and b in tresults["match_results"][a]:
-                mr = tresults["match_results"][a][b]
-                wins += mr.get("wins1", 0)
-                ties += mr.get("ties", 0)
-                matches += mr.get("wins1", 0) + mr.get("wins2", 0) + mr.get("ties", 0)
-        win_rate = wins / matches if matches else 0
-        tie_rate = ties / matches if matches else 0
-        arch_stats[a] = {"win_rate": win_rate, "tie_rate": tie_rate, "matches": matches}
+    arch_stats = {
+        n: {"win_rate": tresults["win_rates"][n], "tie_rate": tresults["tie_rates"][n],
+            "matches": tresults["totals"][n]["matches"]}
+        for n in names
+    }
 
     # Sort by win rate descending
     sorted_names = sorted(names, key=lambda n: arch_stats[n]["win_rate"], reverse=True)
@@ -406,17 +403,18 @@ def run_archetype_tournament():
 
 
 
-def run_hand_testing():
+def run_hand_testing(game_engine: GameEngine = ENGINE):
     """Run special dice vs normal dice testing"""
     print("🎲 Running Special Dice Testing...")
 
-    game_engine = GameEngine()
     tester = HandTester(game_engine)
 
+    # Each die variant is independent, so spread them over every core
+    processes = os.cpu_count() or 1
     # Test all special dice (full game mode)
-    test_results = tester.test_all_special_dice(num_tests=1000)
+    test_results = tester.test_all_special_dice(num_tests=1000, processes=processes)
     # Pure one-roll mode baseline
-    pure_results = tester.test_all_special_dice_pure(num_tests=5000)
+    pure_results = tester.test_all_special_dice_pure(num_tests=5000, processes=processes)
 
     # Get performance ranking
     performance_ranking = tester.compare_dice_performance(test_results)
@@ -434,9 +432,8 @@ def run_hand_testing():
     return test_results, performance_ranking, pure_results
 
 
-def run_defense_testing():
+def run_defense_testing(game_engine: GameEngine = ENGINE):
     print("🎲 Running Defense Dice Testing...")
-    game_engine = GameEngine()
     sim = DefenseSimulator(game_engine)
 
     # Build archetype list
@@ -451,7 +448,7 @@ def run_defense_testing():
 
     results = {}
     for name, faces in DEFENSE_DICE_DEFINITIONS.items():
-        print(f"Testing defense die: {name} {faces}")
+        print(f"Testing defense die: {name} {list(faces)}")
         # psychological
         d_die = SpecialFaceDice(faces, name)
         psych = sim.simulate_defense(name, d_die, 'psychological', archetypes, num_matches=500)
@@ -465,8 +462,6 @@ def run_defense_testing():
 
 def run_synergy_testing():
     print("🎲 Running Synergy Testing...")
-    game_engine = GameEngine()
-    # engine not needed, but keeping structure consistent
     archs = [
         TabulaRasa(), Hedonist(), Physiognomist(), Rationalist(), Fatalist(),
         Transcendentalist(), Puritan(), Machiavalian(), Absurdist(), Stoic(), Nihilist()
@@ -487,9 +482,8 @@ def run_synergy_testing():
     return averages, keyword_freq
 
 
-def run_bias_emotion_testing():
+def run_bias_emotion_testing(game_engine: GameEngine = ENGINE):
     print("🎲 Running Bias + Emotion Testing...")
-    game_engine = GameEngine()
     archs = [
         TabulaRasa(), Hedonist(), Physiognomist(), Rationalist(), Fatalist(),
         Transcendentalist(), Puritan(), Machiavalian(), Absurdist(), Stoic(), Nihilist()
@@ -533,28 +527,30 @@ def generate_reports(archetype_results, hand_test_results, performance_ranking,
             synergy_keyword_values=kw_vals
         )
 
-        with open(output_dir / "archetypes_testing.html", "w") as f:
-            f.write(archetype_html)
+        (output_dir / "archetypes_testing.html").write_text(archetype_html)
 
     # Generate hand testing report
     hand_template = env.get_template("hand_testing.j2")
 
     # Prepare data for hand testing template
     # Build rows from both pure (one-roll) and full-game stats
-    rows = []
-    for key, full in hand_test_results.items():
-        pure = pure_results.get(key, {"win_rate": 0, "tie_rate": 0})
-        rows.append({
+    no_pure = {"win_rate": 0, "tie_rate": 0}
+    rows = [
+        {
             "key": key,
             "name": str(full["special_faces"]),
             "pure_win": pure["win_rate"],
             "pure_tie": pure["tie_rate"],
+            "pure_total": pure["win_rate"] + pure["tie_rate"],
             "full_win": full["win_rate"],
             "full_tie": full["tie_rate"],
             "net": full["avg_net_damage"]
-        })
+        }
+        for key, full in hand_test_results.items()
+        for pure in (pure_results.get(key, no_pure),)
+    ]
     # Sort by pure win+tie desc; tiebreaker by full net damage
-    rows.sort(key=lambda r: (r["pure_win"] + r["pure_tie"], r["net"]), reverse=True)
+    rows.sort(key=itemgetter("pure_total", "net"), reverse=True)
 
     dice_names = [r["name"] for r in rows]
     pure_win_rates = [r["pure_win"] for r in rows]
@@ -574,8 +570,7 @@ def generate_reports(archetype_results, hand_test_results, performance_ranking,
         net_damages=net_damages
     )
 
-    with open(output_dir / "hand_testing.html", "w") as f:
-        f.write(hand_html)
+    (output_dir / "hand_testing.html").write_text(hand_html)
 
     # Bias (formerly defense) testing report (only if results available)
     if isinstance(defense_results, dict) and defense_results and all(isinstance(v, dict) for v in defense_results.values()):
@@ -601,8 +596,7 @@ def generate_reports(archetype_results, hand_test_results, performance_ranking,
             triggers_per_round_psych=trig_round_psych,
             triggers_per_round_som=trig_round_som
         )
-        with open(output_dir / "bias_testing.html", "w") as f:
-            f.write(defense_html)
+        (output_dir / "bias_testing.html").write_text(defense_html)
 
     # Ensure assets dir exists for images (relative path used by HTML)
     assets_dir = project_root / "assets"
@@ -614,12 +608,9 @@ def generate_reports(archetype_results, hand_test_results, performance_ranking,
     def_cards = build_card_data_defense()
     emo_cards = build_card_data_emotions()
 
-    with open(output_dir / "archetypes_print.html", "w") as f:
-        f.write(cards_template.render(title="Archetype Cards", cards=arch_cards))
-    with open(output_dir / "bias_print.html", "w") as f:
-        f.write(cards_template.render(title="Bias Dice Cards", cards=def_cards))
-    with open(output_dir / "emotions_print.html", "w") as f:
-        f.write(cards_template.render(title="Emotion Cards", cards=emo_cards))
+    (output_dir / "archetypes_print.html").write_text(cards_template.render(title="Archetype Cards", cards=arch_cards))
+    (output_dir / "bias_print.html").write_text(cards_template.render(title="Bias Dice Cards", cards=def_cards))
+    (output_dir / "emotions_print.html").write_text(cards_template.render(title="Emotion Cards", cards=emo_cards))
 
     # Bias + Emotion testing report
     bet = env.get_template("bias_emotion_testing.j2")
@@ -636,30 +627,29 @@ def generate_reports(archetype_results, hand_test_results, performance_ranking,
     arch_names2, arch_win, arch_tie = to_stacked_arrays_sorted(bias_emotion_results.get('archetype_stats', {}))
     # Top 30 pairings by win+tie
     pairs = bias_emotion_results.get('pair_stats', {})
-    pair_sorted = sorted(pairs.items(), key=lambda kv: (kv[1].get('win_rate', 0)+kv[1].get('tie_rate',0)), reverse=True)[:30]
+    pair_sorted = heapq.nlargest(30, pairs.items(), key=lambda kv: (kv[1].get('win_rate', 0)+kv[1].get('tie_rate',0)))
     pair_names = [k for k,_ in pair_sorted]
     pair_win = [v.get('win_rate',0) for _,v in pair_sorted]
     pair_tie = [v.get('tie_rate',0) for _,v in pair_sorted]
     loops = bias_emotion_results.get('loops', {})
     loop_labels = list(loops.keys())
     loop_counts = [loops[k] for k in loop_labels]
-    with open(output_dir / "bias_emotion_testing.html", "w") as f:
-        f.write(bet.render(
-            emotion_names=emotion_names,
-            emotion_win=emotion_win,
-            emotion_tie=emotion_tie,
-            bias_names=bias_names,
-            bias_win=bias_win,
-            bias_tie=bias_tie,
-            arch_names=arch_names2,
-            arch_win=arch_win,
-            arch_tie=arch_tie,
-            pair_names=pair_names,
-            pair_win=pair_win,
-            pair_tie=pair_tie,
-            loop_labels=loop_labels,
-            loop_counts=loop_counts,
-        ))
+    (output_dir / "bias_emotion_testing.html").write_text(bet.render(
+        emotion_names=emotion_names,
+        emotion_win=emotion_win,
+        emotion_tie=emotion_tie,
+        bias_names=bias_names,
+        bias_win=bias_win,
+        bias_tie=bias_tie,
+        arch_names=arch_names2,
+        arch_win=arch_win,
+        arch_tie=arch_tie,
+        pair_names=pair_names,
+        pair_win=pair_win,
+        pair_tie=pair_tie,
+        loop_labels=loop_labels,
+        loop_counts=loop_counts,
+    ))
 
     print("📊 Reports generated:")
     print("  - output/archetypes_testing.html")
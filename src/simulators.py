@@ -3,6 +3,7 @@ Simulation engines for Psycho-Dice-Namic
 """
 
 from typing import List, Dict, Any, Tuple
+import multiprocessing
 import random
 from collections import defaultdict, Counter
 import statistics
@@ -74,53 +75,72 @@ class ArchetypeSimulator:
         return results
 
     def simulate_tournament(self, archetypes: List[Archetype],
-                           matches_per_pair: int = 100) -> Dict[str, Any]:
-        """Simulate a round-robin tournament between multiple archetypes"""
+                           matches_per_pair: int = 100, processes: int = 1) -> Dict[str, Any]:
+        """Simulate a round-robin tournament between multiple archetypes.
+        With processes > 1, pairings run in a process pool, each on its own engine and seed.
+        """
         results = {
             "archetypes": [arch.name for arch in archetypes],
             "match_results": {},
             "win_rates": {},
+            "tie_rates": {},
+            # Per archetype: wins, ties and matches summed over all of its pairings
+            "totals": {},
             "total_matches": 0
         }
 
         # Initialize results
+        totals = results["totals"]
         for arch in archetypes:
             results["win_rates"][arch.name] = 0
             results["match_results"][arch.name] = {}
+            totals[arch.name] = {"wins": 0, "ties": 0, "matches": 0}
 
         # Play all pairs
-        for i, arch1 in enumerate(archetypes):
-            for j, arch2 in enumerate(archetypes):
-                if i < j:  # Avoid duplicate matches
-                    match_result = self.simulate_matches(arch1, arch2, matches_per_pair)
-                    results["match_results"][arch1.name][arch2.name] = match_result
-                    results["match_results"][arch2.name][arch1.name] = {
-                        "archetype1": arch2.name,
-                        "archetype2": arch1.name,
-                        "wins1": match_result["wins2"],
-                        "wins2": match_result["wins1"],
-                        "ties": match_result["ties"],
-                        "win_rate1": match_result["win_rate2"],
-                        "win_rate2": match_result["win_rate1"],
-                        "tie_rate": match_result["tie_rate"]
-                    }
-                    results["total_matches"] += matches_per_pair
-
-        # Calculate overall win rates
-        for arch in archetypes:
-            total_wins = 0
-            total_matches = 0
-            for other_arch in archetypes:
-                if arch.name != other_arch.name:
-                    if arch.name in results["match_results"] and other_arch.name in results["match_results"][arch.name]:
-                        match_data = results["match_results"][arch.name][other_arch.name]
-                        total_wins += match_data["wins1"]
-                        total_matches += match_data["wins1"] + match_data["wins2"] + match_data["ties"]
-            results["win_rates"][arch.name] = total_wins / total_matches if total_matches > 0 else 0
+        pairs = [(arch1, arch2) for i, arch1 in enumerate(archetypes)
+                 for j, arch2 in enumerate(archetypes) if i < j]  # Avoid duplicate matches
+        if processes > 1:
+            # Pairings share no state; seeds come from this process's generator so a seeded run is repeatable
+            jobs = [(arch1, arch2, matches_per_pair, random.randrange(2 ** 32)) for arch1, arch2 in pairs]
+            with multiprocessing.Pool(processes) as pool:
+                match_results = pool.starmap(_simulate_pair, jobs)
+        else:
+            match_results = [self.simulate_matches(arch1, arch2, matches_per_pair) for arch1, arch2 in pairs]
+        for (arch1, arch2), match_result in zip(pairs, match_results):
+            results["match_results"][arch1.name][arch2.name] = match_result
+            results["match_results"][arch2.name][arch1.name] = {
+                "archetype1": arch2.name,
+                "archetype2": arch1.name,
+                "wins1": match_result["wins2"],
+                "wins2": match_result["wins1"],
+                "ties": match_result["ties"],
+                "win_rate1": match_result["win_rate2"],
+                "win_rate2": match_result["win_rate1"],
+                "tie_rate": match_result["tie_rate"]
+            }
+            results["total_matches"] += matches_per_pair
+            # Fold the pairing into both sides' totals as it arrives
+            played = match_result["wins1"] + match_result["wins2"] + match_result["ties"]
+            for name, wins in ((arch1.name, match_result["wins1"]), (arch2.name, match_result["wins2"])):
+                t = totals[name]
+                t["wins"] += wins
+                t["ties"] += match_result["ties"]
+                t["matches"] += played
+
+        # Calculate overall win and tie rates
+        for name, t in totals.items():
+            results["win_rates"][name] = t["wins"] / t["matches"] if t["matches"] > 0 else 0
+            results["tie_rates"][name] = t["ties"] / t["matches"] if t["matches"] > 0 else 0
 
         return results
 
 
+def _simulate_pair(archetype1: Archetype, archetype2: Archetype, num_matches: int, seed: int) -> Dict[str, Any]:
+    """Process-pool worker for simulate_tournament: one pairing on a fresh engine with its own seed"""
+    random.seed(seed)
+    return ArchetypeSimulator(GameEngine()).simulate_matches(archetype1, archetype2, num_matches)
+
+
 class HandTester:
     """Tests arbitrary hands against normal hands"""
 
@@ -130,7 +150,7 @@ class HandTester:
     def test_special_dice(self, special_faces: List[int], num_tests: int = 1000) -> Dict[str, Any]:
         """Test a special dice against normal dice"""
         results = {
-            "special_faces": special_faces,
+            "special_faces": list(special_faces),
             "damage_differences": [],
             "wins": 0,
             "losses": 0,
@@ -159,7 +179,7 @@ class HandTester:
 
             # Create players
             special_player = Player("Special", health=MAX_HEALTH, dice=special_dice)
-            normal_player = Player("Normal", health=MAX_HEALTH, dice=normal_archetype.dice)
+            normal_player = normal_archetype.create_player("Normal")
 
             # Simulate the full debate
             debate_result = self.game_engine.play_debate(special_player, special_archetype, normal_player, normal_archetype)
@@ -196,12 +216,20 @@ class HandTester:
 
         return results
 
-    def test_all_special_dice(self, num_tests: int = 1000) -> Dict[str, Any]:
-        """Test all predefined special dice"""
-        results = {}
+    def test_all_special_dice(self, num_tests: int = 1000, processes: int = 1) -> Dict[str, Any]:
+        """Test all predefined special dice.
+        With processes > 1, each die runs in a process pool on its own engine and seed.
+        """
+        if processes > 1:
+            for name, faces in SPECIAL_DICE_DEFINITIONS.items():
+                print(f"Testing {name}: {list(faces)}")
+            jobs = [(faces, num_tests, random.randrange(2 ** 32)) for faces in SPECIAL_DICE_DEFINITIONS.values()]
+            with multiprocessing.Pool(processes) as pool:
+                return dict(zip(SPECIAL_DICE_DEFINITIONS, pool.starmap(_test_special_dice, jobs)))
 
+        results = {}
         for name, faces in SPECIAL_DICE_DEFINITIONS.items():
-            print(f"Testing {name}: {faces}")
+            print(f"Testing {name}: {list(faces)}")
             results[name] = self.test_special_dice(faces, num_tests)
 
         return results
@@ -209,7 +237,7 @@ class HandTester:
     def test_special_dice_pure(self, special_faces: List[int], num_tests: int = 1000) -> Dict[str, Any]:
         """Pure one-roll hand vs hand: 2x special + 4x normal vs 6x normal, no AI, no tokens."""
         results = {
-            "special_faces": special_faces,
+            "special_faces": list(special_faces),
             "wins": 0,
             "losses": 0,
             "ties": 0,
@@ -217,10 +245,10 @@ class HandTester:
 
         import random
         for _ in range(num_tests):
-            # Roll 2 special dice by choosing from faces (can include None)
+            # Roll 2 special dice by choosing from faces (can include None); blank faces drop out of the hand
             s1 = random.choice(special_faces)
             s2 = random.choice(special_faces)
-            special_hand = [s1, s2] + [random.randint(1, 6) for _ in range(4)]
+            special_hand = [s for s in (s1, s2) if s is not None] + [random.randint(1, 6) for _ in range(4)]
             normal_hand = [random.randint(1, 6) for _ in range(6)]
 
             match_result = self.game_engine.play_hand_vs_hand(special_hand, normal_hand)
@@ -237,8 +265,12 @@ class HandTester:
         results["loss_rate"] = results["losses"] / num_tests
         return results
 
-    def test_all_special_dice_pure(self, num_tests: int = 1000) -> Dict[str, Any]:
-        """Pure one-roll for all predefined special dice"""
+    def test_all_special_dice_pure(self, num_tests: int = 1000, processes: int = 1) -> Dict[str, Any]:
+        """Pure one-roll for all predefined special dice (in a process pool when processes > 1)"""
+        if processes > 1:
+            jobs = [(faces, num_tests, random.randrange(2 ** 32)) for faces in SPECIAL_DICE_DEFINITIONS.values()]
+            with multiprocessing.Pool(processes) as pool:
+                return dict(zip(SPECIAL_DICE_DEFINITIONS, pool.starmap(_test_special_dice_pure, jobs)))
         results = {}
         for name, faces in SPECIAL_DICE_DEFINITIONS.items():
             results[name] = self.test_special_dice_pure(faces, num_tests)
@@ -258,6 +290,24 @@ class HandTester:
         return sorted(performance, key=lambda x: x[1], reverse=True)
 
 
+def _test_special_dice(special_faces: List[int], num_tests: int, seed: int) -> Dict[str, Any]:
+    """Process-pool worker for test_all_special_dice: one die on a fresh engine with its own seed"""
+    random.seed(seed)
+    return HandTester(GameEngine()).test_special_dice(special_faces, num_tests)
+
+
+def _test_special_dice_pure(special_faces: List[int], num_tests: int, seed: int) -> Dict[str, Any]:
+    """Process-pool worker for test_all_special_dice_pure"""
+    random.seed(seed)
+    return HandTester(GameEngine()).test_special_dice_pure(special_faces, num_tests)
+
+
+class _DefenseArchetype(Archetype):
+    """Archetype clone that also records the defense die under test"""
+
+    __slots__ = ("_somatic_defense_die", "_defense_mode")
+
+
 class DefenseSimulator:
     """Simulates defense dice triggers across archetypes vs Tabula Rasa."""
 
@@ -274,9 +324,9 @@ class DefenseSimulator:
                     dice[i] = defense_die
                     break
         # For somatic, we don't insert into dice pool; we attach as attribute
-        new_arch = Archetype(f"{archetype.name}+Def", dice)
-        setattr(new_arch, "_somatic_defense_die", defense_die if mode == 'somatic' else None)
-        setattr(new_arch, "_defense_mode", mode)
+        new_arch = _DefenseArchetype(f"{archetype.name}+Def", dice)
+        new_arch._somatic_defense_die = defense_die if mode == 'somatic' else None
+        new_arch._defense_mode = mode
         return new_arch
 
     def _eval_triggers(self, defense_key: str, mode: str, debate_result, rounds_p1, rounds_p2) -> Tuple[int, int]:
@@ -491,10 +541,10 @@ class SynergySimulator:
 
     def simulate(self, archetypes: List[Archetype], num_games: int = 100) -> Dict[str, float]:
         from emotions import EMOTION_DEFINITIONS
-        from archetypes import DEFENSE_DICE_DESCRIPTIONS, DEFENSE_DICE_DEFINITIONS
+        from archetypes import defense_dice_descriptions, DEFENSE_DICE_DEFINITIONS
         results: Dict[str, float] = {}
         defense_items = []
-        for name, desc in DEFENSE_DICE_DESCRIPTIONS.items():
+        for name, desc in defense_dice_descriptions().items():
             text = (desc.get('psych','') + ' ' + desc.get('som',''))
             faces = DEFENSE_DICE_DEFINITIONS.get(name, [])
             nums = [v for v in faces if isinstance(v, int)]
@@ -524,7 +574,7 @@ class SynergySimulator:
                     best_e = None; best_e_kws = set(); best_e_score = -1
                     e_with_kws = []
                     for e in e_choices:
-                        ek = self.extract_keywords(e['markdown'])
+                        ek = self.extract_keywords(e.markdown)
                         e_with_kws.append((e, ek))
                         sc = overlap_score(ek)
                         if sc > best_e_score or (sc == best_e_score and len(ek) > len(best_e_kws)):
@@ -562,11 +612,11 @@ class SynergySimulator:
     def keyword_frequencies(self, archetypes: List[Archetype], num_games: int = 100) -> Dict[str, float]:
         """Estimate distribution of which keywords drive overlaps across sampled selections."""
         from emotions import EMOTION_DEFINITIONS
-        from archetypes import DEFENSE_DICE_DESCRIPTIONS, DEFENSE_DICE_DEFINITIONS
+        from archetypes import defense_dice_descriptions, DEFENSE_DICE_DEFINITIONS
         freq: Dict[str, int] = {k: 0 for k in self.KEYWORDS}
         total_overlaps = 0
         defense_items = []
-        for name, desc in DEFENSE_DICE_DESCRIPTIONS.items():
+        for name, desc in defense_dice_descriptions().items():
             text = (desc.get('psych','') + ' ' + desc.get('som',''))
             faces = DEFENSE_DICE_DEFINITIONS.get(name, [])
             nums = [v for v in faces if isinstance(v, int)]
@@ -589,7 +639,7 @@ class SynergySimulator:
                     def overlap_score(tags: set) -> int:
                         return len(tags & current_keywords)
                     # select best emotion
-                    e_with_kws = [(e, self.extract_keywords(e['markdown'])) for e in e_choices]
+                    e_with_kws = [(e, self.extract_keywords(e.markdown)) for e in e_choices]
                     best_e, best_e_kws = max(e_with_kws, key=lambda x: (overlap_score(x[1]), len(x[1])))
                     if overlap_score(best_e_kws) <= 0:
                         best_e, best_e_kws = max(e_with_kws, key=lambda x: len(x[1]))
@@ -634,16 +684,18 @@ class BiasEmotionSimulator:
         for slot, (name, faces) in zip(replace_slots, psych_dice):
             dice_copy[slot] = SpecialFaceDice(faces, name)
         class TempArch(Archetype):
+            __slots__ = ()
+
             def __init__(self, name: str, dice):
                 super().__init__(name, dice)
         return TempArch(base.name, dice_copy)
 
     def simulate(self, archetypes: List[Archetype], num_games_per_arch: int = 200) -> Dict[str, Any]:
-        from emotions import EMOTION_DEFINITIONS
+        from emotions import EMOTIONS_BY_NAME
         from emotions_runtime import create_emotions
         from archetypes import DEFENSE_DICE_DEFINITIONS
 
-        emotion_names = [e['name'] for e in EMOTION_DEFINITIONS]
+        emotion_names = list(EMOTIONS_BY_NAME)
         defense_list = list(DEFENSE_DICE_DEFINITIONS.items())
 
         emotion_stats: Dict[str, Dict[str, int]] = {}
@@ -672,9 +724,9 @@ class BiasEmotionSimulator:
                 p1 = aug.create_player('P1')
                 p2 = opp_base.create_player('P2')
                 # metadata attach (not used by engine yet)
-                p1.bias_psych = [n for n, _ in psych]  # type: ignore
-                p1.bias_somatic = [n for n, _ in som]  # type: ignore
-                p1.emotions = create_emotions(emos)  # type: ignore
+                p1.bias_psych = [n for n, _ in psych]
+                p1.bias_somatic = [n for n, _ in som]
+                p1.emotions = create_emotions(emos)
 
                 debate = self.game_engine.play_debate(p1, aug, p2, opp_base, max_rounds=self.max_rounds)  # type: ignore
 
@@ -735,57 +787,3 @@ class BiasEmotionSimulator:
             'pair_stats': summarize(pair_counts),
             'loops': loop_loadouts,
         }
-
-    def keyword_frequencies(self, archetypes: List[Archetype], num_games: int = 100) -> Dict[str, float]:
-        from emotions import EMOTION_DEFINITIONS
-        from archetypes import DEFENSE_DICE_DESCRIPTIONS, DEFENSE_DICE_DEFINITIONS
-        freq: Dict[str, int] = {k: 0 for k in self.KEYWORDS}
-        total_overlaps = 0
-        defense_items = []
-        for name, desc in DEFENSE_DICE_DESCRIPTIONS.items():
-            text = (desc.get('psych','') + ' ' + desc.get('som',''))
-            faces = DEFENSE_DICE_DEFINITIONS.get(name, [])
-            nums = [v for v in faces if isinstance(v, int)]
-            if nums:
-                odd_count = sum(1 for v in nums if v % 2 == 1)
-                even_count = sum(1 for v in nums if v % 2 == 0)
-                if even_count <= 1:
-                    text += ' odd'
-                if odd_count <= 1:
-                    text += ' even'
-            defense_items.append((name, text))
-        for arch in archetypes:
-            for _ in range(num_games):
-                current_keywords = set(self.archetype_keywords(arch))
-                chosen_emotion_keywords = []
-                chosen_die_keywords = []
-                for _p in range(3):
-                    e_choices = random.sample(EMOTION_DEFINITIONS, k=min(3, len(EMOTION_DEFINITIONS)))
-                    d_choices = random.sample(defense_items, k=min(3, len(defense_items)))
-                    def overlap_score(tags: set) -> int:
-                        return len(tags & current_keywords)
-                    # best emotion
-                    e_with_kws = [(e, self.extract_keywords(e['markdown'])) for e in e_choices]
-                    best_e, best_e_kws = max(e_with_kws, key=lambda x: (overlap_score(x[1]), len(x[1])))
-                    if overlap_score(best_e_kws) <= 0:
-                        best_e, best_e_kws = max(e_with_kws, key=lambda x: len(x[1]))
-                    chosen_emotion_keywords.append(best_e_kws)
-                    current_keywords |= best_e_kws
-                    # best die
-                    d_with_kws = [((name, txt), self.extract_keywords(txt)) for name, txt in d_choices]
-                    best_d, best_d_kws = max(d_with_kws, key=lambda x: (overlap_score(x[1]), len(x[1])))
-                    if overlap_score(best_d_kws) <= 0:
-                        best_d, best_d_kws = max(d_with_kws, key=lambda x: len(x[1]))
-                    chosen_die_keywords.append(best_d_kws)
-                    current_keywords |= best_d_kws
-                # accumulate overlaps
-                for ek in chosen_emotion_keywords:
-                    for dk in chosen_die_keywords:
-                        inter = ek & dk
-                        if inter:
-                            total_overlaps += 1
-                            for kw in inter:
-                                freq[kw] = freq.get(kw, 0) + 1
-        if total_overlaps == 0:
-            return {k: 0.0 for k in freq}
-        return {k: (v / total_overlaps) for k, v in freq.items()}